@@ -14,7 +14,7 @@ from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
-from app.dependencies import get_redis
+from app.dependencies import get_redis, get_whitelabel_service
 from app.logging_config import get_logger
 from services.pdf_report import generate_pdf_report
 from services.stripe_service import UserTier, get_tier_features
@@ -169,12 +169,11 @@ async def remove_team_member(
 async def save_whitelabel_config(
     config: WhiteLabelConfig,
     user: EnterpriseUser = Depends(require_enterprise),
-    redis: Any = Depends(get_redis),
+    service: WhiteLabelService = Depends(get_whitelabel_service),
 ) -> TeamDashboardResponse:
     """Save or update white-label branding configuration."""
     if config.org_id != user.org_id:
         raise HTTPException(status_code=403, detail="Cannot modify other org's config")
-    service = WhiteLabelService(redis)
     result = await service.save_config(config)
     return TeamDashboardResponse(
         data=result,
@@ -185,10 +184,9 @@ async def save_whitelabel_config(
 @router.get("/whitelabel", response_model=TeamDashboardResponse)
 async def get_whitelabel_config(
     user: EnterpriseUser = Depends(require_enterprise),
-    redis: Any = Depends(get_redis),
+    service: WhiteLabelService = Depends(get_whitelabel_service),
 ) -> TeamDashboardResponse:
     """Get current white-label branding configuration."""
-    service = WhiteLabelService(redis)
     config = await service.get_config(user.org_id)
     if config is None:
         return TeamDashboardResponse(
@@ -204,10 +202,9 @@ async def get_whitelabel_config(
 @router.get("/whitelabel/branding", response_model=TeamDashboardResponse)
 async def get_branding(
     user: EnterpriseUser = Depends(require_enterprise),
-    redis: Any = Depends(get_redis),
+    service: WhiteLabelService = Depends(get_whitelabel_service),
 ) -> TeamDashboardResponse:
     """Get branding data for frontend rendering."""
-    service = WhiteLabelService(redis)
     branding = await service.get_branding(user.org_id)
     return TeamDashboardResponse(
         data=branding,
@@ -218,10 +215,9 @@ async def get_branding(
 @router.delete("/whitelabel")
 async def delete_whitelabel_config(
     user: EnterpriseUser = Depends(require_enterprise),
-    redis: Any = Depends(get_redis),
+    service: WhiteLabelService = Depends(get_whitelabel_service),
 ) -> TeamDashboardResponse:
     """Delete white-label configuration."""
-    service = WhiteLabelService(redis)
     deleted = await service.delete_config(user.org_id)
     return TeamDashboardResponse(
         data={"deleted": deleted},
@@ -260,10 +256,9 @@ class PDFReportRequest(BaseModel):
 async def generate_report(
     request: PDFReportRequest,
     user: EnterpriseUser = Depends(require_enterprise),
-    redis: Any = Depends(get_redis),
+    service: WhiteLabelService = Depends(get_whitelabel_service),
 ) -> Response:
     """Generate a premium PDF developer scorecard."""
-    service = WhiteLabelService(redis)
     branding = await service.get_branding(user.org_id)
 
     pdf_bytes = generate_pdf_report(
@@ -0,0 +1,21 @@
+"""Shared wall-clock helpers.
+
+Timestamps stamped on results are UTC ISO-8601 with second precision
+and an explicit ``+00:00`` offset, e.g. ``2023-11-14T22:13:20+00:00``.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+
+_last_iso: tuple[int, str] = (0, "")
+
+
+def utc_now_iso() -> str:
+    """Current UTC time in ISO-8601, formatted at most once per second."""
+    global _last_iso
+    now = int(time.time())
+    if now != _last_iso[0]:
+        _last_iso = (now, datetime.fromtimestamp(now, UTC).isoformat())
+    return _last_iso[1]
@@ -1,12 +1,15 @@
 """Application-level dependencies.
 
-Provides Redis connection, rate limiting, and session management
-as FastAPI dependencies for injection into route handlers.
+Provides Redis connection, the shared Stripe client, the white-label service,
+rate limiting, and session management as FastAPI dependencies for injection
+into route handlers.
 """
 
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from typing import Any
+from weakref import WeakKeyDictionary
 
 import redis.asyncio as aioredis
 from fastapi import Depends, Request
@@ -15,6 +18,8 @@ from app.config import get_settings
 from app.exceptions import RateLimitError, SessionNotFoundError
 from app.logging_config import get_logger
 from app.metrics import RATE_LIMIT_HITS
+from services.stripe_service import StripeService
+from services.whitelabel import WhiteLabelService
 
 logger = get_logger(__name__)
 
@@ -51,6 +56,45 @@ async def get_redis() -> AsyncGenerator[aioredis.Redis, None]:
     yield _redis_pool
 
 
+# Global Stripe service; owns the pooled HTTP client to the Stripe API
+_stripe_service: StripeService | None = None
+
+
+def init_stripe() -> None:
+    """Create the process-wide Stripe service."""
+    global _stripe_service
+    _stripe_service = StripeService()
+
+
+async def close_stripe() -> None:
+    """Close the Stripe service's pooled HTTP client."""
+    global _stripe_service
+    if _stripe_service:
+        await _stripe_service.aclose()
+        _stripe_service = None
+
+
+def get_stripe_service() -> StripeService:
+    """Get the shared Stripe service as a FastAPI dependency."""
+    if _stripe_service is None:
+        raise RuntimeError("Stripe not initialized. Call init_stripe() first.")
+    return _stripe_service
+
+
+# One white-label service per Redis client, so its config cache spans requests
+_whitelabel_services: WeakKeyDictionary[Any, WhiteLabelService] = WeakKeyDictionary()
+
+
+def get_whitelabel_service(
+    redis: aioredis.Redis = Depends(get_redis),
+) -> WhiteLabelService:
+    """Get the white-label service for the Redis client as a FastAPI dependency."""
+    service = _whitelabel_services.get(redis)
+    if service is None:
+        service = _whitelabel_services[redis] = WhiteLabelService(redis)
+    return service
+
+
 async def get_session_data(
     request: Request,
     redis: aioredis.Redis = Depends(get_redis),
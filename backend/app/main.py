@@ -45,11 +45,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     )
 
     # Initialize Redis connection pool
-    from app.dependencies import close_redis, init_redis
+    from app.dependencies import close_redis, close_stripe, init_redis, init_stripe
 
     await init_redis()
     logger.info("redis_connected")
 
+    # Shared Stripe service; its pooled HTTP client lives for the app's lifetime
+    init_stripe()
+
     # Initialize database
     from db.session import init_db
 
@@ -61,6 +64,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("application_shutting_down")
     await close_redis()
+    await close_stripe()
     from db.session import close_db
 
     await close_db()
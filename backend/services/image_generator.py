@@ -24,9 +24,9 @@ class ImageGenerator:
     def __init__(self) -> None:
         from services.model_connector import get_connector
         from services.packager import Packager, Renderer
-        from services.prompt_orchestrator import PromptOrchestrator
+        from services.prompt_orchestrator import orchestrator
 
-        self.prompt_orchestrator = PromptOrchestrator()
+        self.prompt_orchestrator = orchestrator
         self.renderer = Renderer()
         self.packager = Packager()
         self._get_connector = get_connector
@@ -273,7 +273,7 @@ class ImageGenerator:
         scores = scoring_result.get("scores", {})
         tech = scoring_result.get("tech_profile", {})
 
-        languages = ", ".join(lang["name"] for lang in tech.get("languages", [])[:5])
+        languages = ", ".join([lang["name"] for lang in tech.get("languages", [])[:5]])
         frameworks = ", ".join(tech.get("frameworks", [])[:5])
 
         return f"""# Developer Profile
@@ -13,616 +13,478 @@ Supports model-specific prompt formatting:
 Template tiers:
 - Free: portfolio_banner, skill_wheel, social_card (3 templates)
 - Pro: All free + 10 premium templates (13 total)
+
+Template text lives in prompt_templates.json next to this module.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import json
+import keyword
+import string
+import sys
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-# --- README TEMPLATES ---
-
-README_TEMPLATES = {
-    "professional": {
-        "system": (
-            "You are an expert tech writer specializing in GitHub profile READMEs. "
-            "Create concise, professional, and visually appealing README content. "
-            "Use markdown formatting with headers, badges, and tables. "
-            "Do not include any fake or placeholder data."
-        ),
-        "user": (
-            "Create a GitHub profile README for a {archetype_name} developer.\n\n"
-            "Profile Summary:\n"
-            "- Top Languages: {top_languages}\n"
-            "- Frameworks: {frameworks}\n"
-            "- Activity Score: {activity_score}/100\n"
-            "- Collaboration Score: {collab_score}/100\n"
-            "- Stack Diversity: {diversity_score}/100\n"
-            "- AI Savviness: {ai_score}/100\n"
-            "- Top Repositories: {top_repos}\n"
-            "{career_goal_section}"
-            "\nStyle: {style}\n"
-            "Include: A brief intro, skills section, stats visualization placeholders, "
-            "and a contact section. Keep it under 80 lines."
-        ),
-        "tier": "free",
-    },
-    "creative": {
-        "system": (
-            "You are a creative developer branding specialist. "
-            "Create eye-catching, personality-driven GitHub profile READMEs. "
-            "Use emojis, creative headers, and engaging language. "
-            "Make it stand out while remaining professional."
-        ),
-        "user": (
-            "Create a creative GitHub profile README for a {archetype_name}.\n\n"
-            "Developer Identity:\n"
-            "- Core Stack: {top_languages}\n"
-            "- Tools: {frameworks}\n"
-            "- Archetype: {archetype_name} - {archetype_description}\n"
-            "- Scores: Activity {activity_score}, Collab {collab_score}, "
-            "Diversity {diversity_score}, AI {ai_score}\n"
-            "- Best Work: {top_repos}\n"
-            "{career_goal_section}"
-            "\nMake it memorable and authentic."
-        ),
-        "tier": "free",
-    },
-    "storyteller": {
-        "system": (
-            "You are a narrative designer who creates developer stories. "
-            "Write a GitHub README that tells the developer's coding journey "
-            "as a compelling narrative. Use metaphors from their archetype. "
-            "Balance storytelling with useful technical information."
-        ),
-        "user": (
-            "Write a story-driven GitHub README for a {archetype_name}.\n\n"
-            "The Developer's Journey:\n"
-            "- Languages mastered: {top_languages}\n"
-            "- Arsenal: {frameworks}\n"
-            "- Activity: {activity_score}/100, Collaboration: {collab_score}/100\n"
-            "- Diversity: {diversity_score}/100, AI Savviness: {ai_score}/100\n"
-            "- Flagship projects: {top_repos}\n"
-            "{career_goal_section}"
-            "\nStyle: narrative, engaging, use archetype-themed metaphors.\n"
-            "Include markdown badges and a stats section. Under 100 lines."
-        ),
-        "tier": "pro",
-    },
-    "minimalist": {
-        "system": (
-            "You are a minimalist design expert. Create an ultra-clean GitHub "
-            "README with maximum information density in minimum space. "
-            "Use monospace elements, ASCII art dividers, and sparse formatting. "
-            "Every word must earn its place."
-        ),
-        "user": (
-            "Create a minimalist GitHub README for a {archetype_name}.\n\n"
-            "Core data:\n"
-            "- Stack: {top_languages} | {frameworks}\n"
-            "- Metrics: A:{activity_score} C:{collab_score} "
-            "D:{diversity_score} AI:{ai_score}\n"
-            "- Work: {top_repos}\n"
-            "{career_goal_section}"
-            "\nRules: No emojis, minimal markdown, elegant simplicity. "
-            "Under 40 lines."
-        ),
-        "tier": "pro",
-    },
-    "recruiter_ready": {
-        "system": (
-            "You are a tech recruiter advisor. Create a GitHub README optimized "
-            "for hiring managers and technical recruiters. Emphasize measurable "
-            "achievements, tech stack clarity, and professional presentation. "
-            "Include sections recruiters look for."
-        ),
-        "user": (
-            "Create a recruiter-optimized GitHub README for a {archetype_name}.\n\n"
-            "Professional Profile:\n"
-            "- Technical Stack: {top_languages}\n"
-            "- Frameworks & Tools: {frameworks}\n"
-            "- Activity Score: {activity_score}/100 (consistency indicator)\n"
-            "- Collaboration Score: {collab_score}/100 (team player indicator)\n"
-            "- Stack Diversity: {diversity_score}/100\n"
-            "- AI Proficiency: {ai_score}/100\n"
-            "- Key Projects: {top_repos}\n"
-            "{career_goal_section}"
-            "\nInclude: Summary, Skills Matrix, Featured Projects with impact "
-            "metrics, Open Source Contributions, Contact/Availability section."
-        ),
-        "tier": "pro",
-    },
-}
+class SDPrompt(dict[str, str]):
+    """Read-only positive/negative prompt pair for Stable Diffusion.
+
+    A dict subclass so connectors can keep treating it as a mapping, but
+    immutable so a single cached instance can be handed to every caller.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through the constructor; the default path uses __setitem__
+        return SDPrompt, (dict(self),)
+
+
+class ReadmePrompt(SDPrompt):
+    """Read-only ``{"system", "user"}`` prompt pair for README generation.
+
+    Behaves exactly like the dict it replaces (membership, ``dict()``,
+    JSON), and exposes the fields as attributes. ``user`` is
+    ``user_prefix + user_suffix``: the prefix holds only the style's static
+    instructions, so it is byte-identical across profiles and can be marked
+    as a cacheable segment for provider prompt caching; all profile data
+    lives in the suffix. The split is kept out of the mapping so the
+    serialized prompt (and its hash) stays ``{"system", "user"}``.
+    """
+
+    __slots__ = ("user_prefix", "user_suffix")
+
+    def __init__(
+        self, system: str, user: str, user_prefix: str = "", user_suffix: str = ""
+    ) -> None:
+        dict.__init__(self, system=system, user=user)
+        object.__setattr__(self, "user_prefix", user_prefix)
+        object.__setattr__(self, "user_suffix", user_suffix)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._readonly()
+
+    @property
+    def system(self) -> str:
+        return self["system"]
+
+    @property
+    def user(self) -> str:
+        return self["user"]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return ReadmePrompt, (self.system, self.user, self.user_prefix, self.user_suffix)
+
+
+# --- TEMPLATES ---
+
+_TEMPLATE_FILE = Path(__file__).with_name("prompt_templates.json")
+
+
+def _freeze_object(obj: dict[str, Any]) -> MappingProxyType[str, Any]:
+    """JSON object hook: intern keys and string values, return a read-only view."""
+    return MappingProxyType(
+        {sys.intern(k): sys.intern(v) if isinstance(v, str) else v for k, v in obj.items()}
+    )
+
+
+def _load_templates() -> tuple[Mapping[str, Any], Mapping[str, Any]]:
+    """Load README and image templates from the bundled JSON data file.
+
+    Every mapping at every level is a read-only MappingProxyType, so the
+    registries can be shared freely without defensive copies. All strings
+    are interned so templates, cached renders, and verbatim prompts
+    (system prompts, SD negatives) share one object per string.
+
+    Returns:
+        Tuple of (readme_templates, image_templates).
+    """
+    data = json.loads(_TEMPLATE_FILE.read_text(encoding="utf-8"), object_hook=_freeze_object)
+    return data["readme"], data["image"]
+
+
+# README styles: {style: {system, user_prefix, user_suffix, tier}}
+# Image templates: {template_id: {gemini, stable_diffusion: {positive, negative}, flux, tier}}
+README_TEMPLATES, IMAGE_TEMPLATES = _load_templates()
+
+
+_FORMATTER = string.Formatter()
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """Compile a template string into a renderer taking keyword fields.
 
-# --- IMAGE TEMPLATES ---
-
-IMAGE_TEMPLATES = {
-    # === FREE TIER (3 templates) ===
-    "portfolio_banner": {
-        "gemini": (
-            "Create a minimalistic, dark-themed professional banner for a "
-            "{archetype_name} developer profile. Visual style: {style}. "
-            "Color palette: {colors}. Include abstract geometric symbols "
-            "representing: {top_skills}. Clean, modern design. "
-            "No text, no faces, no logos. 1584x396 pixels."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "minimalistic dark professional banner, abstract geometric art, "
-                "developer portfolio, {style} style, {colors} color palette, "
-                "symbols for {top_skills}, clean modern design, "
-                "high quality, 4k, professional, sleek"
-            ),
-            "negative": (
-                "text, words, letters, face, person, photo, realistic, "
-                "busy, cluttered, low quality, blurry, watermark"
-            ),
-        },
-        "flux": (
-            "Minimalistic dark developer banner. {style} aesthetic. "
-            "{colors} palette. Abstract symbols: {top_skills}. "
-            "Clean, geometric, professional. No text. No faces."
-        ),
-        "tier": "free",
-    },
-    "skill_wheel": {
-        "gemini": (
-            "Create an infographic-style skill wheel visualization for a "
-            "{archetype_name}. Show proficiency levels for: {top_skills}. "
-            "Color scheme: {colors}. Style: {style}. "
-            "Circular/radar chart aesthetic. Dark background. "
-            "Clean typography for skill labels. 1200x1200 pixels."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "infographic skill wheel, circular chart, data visualization, "
-                "{style} design, {colors} colors, dark background, "
-                "professional, clean, modern, high quality, 4k"
-            ),
-            "negative": (
-                "photo, face, person, realistic, messy, cluttered, "
-                "low quality, blurry, watermark, text heavy"
-            ),
-        },
-        "flux": (
-            "Skill wheel infographic. {style} design. {colors}. "
-            "Circular data visualization. Dark background. "
-            "Professional, clean, modern."
-        ),
-        "tier": "free",
-    },
-    "social_card": {
-        "gemini": (
-            "Create a social media card (1200x630) for a {archetype_name} "
-            "developer. Visual style: {style}. Colors: {colors}. "
-            "Include abstract representations of: {top_skills}. "
-            "Space for text overlay at top. Dark, professional. No text."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "social media card, developer profile, abstract tech art, "
-                "{style} style, {colors} palette, professional, modern, "
-                "clean layout, space for text, dark theme, high quality"
-            ),
-            "negative": (
-                "text, words, face, person, cluttered, low quality, "
-                "blurry, watermark, busy background"
-            ),
-        },
-        "flux": (
-            "Social card for {archetype_name}. {style}. {colors}. "
-            "Abstract tech symbols: {top_skills}. Dark. Professional. "
-            "Space for text overlay. No text."
-        ),
-        "tier": "free",
-    },
-    # === PRO TIER (10 premium templates) ===
-    "neon_circuit": {
-        "gemini": (
-            "Create a neon-lit circuit board inspired banner for a "
-            "{archetype_name}. Glowing traces in {colors} on dark PCB. "
-            "Components represent: {top_skills}. Style: {style}. "
-            "Cyberpunk tech aesthetic. 1584x396. No text, no faces."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "neon circuit board art, glowing traces, cyberpunk tech, "
-                "PCB design, {style} style, {colors} neon glow, "
-                "dark background, components for {top_skills}, "
-                "high quality, 4k, ultradetailed, dramatic lighting"
-            ),
-            "negative": (
-                "text, words, face, person, photo, realistic human, "
-                "low quality, blurry, watermark, simple, flat"
-            ),
-        },
-        "flux": (
-            "Neon circuit board banner for {archetype_name}. "
-            "Glowing {colors} traces on dark PCB. {top_skills} as components. "
-            "{style}. Cyberpunk. No text. No faces."
-        ),
-        "tier": "pro",
-    },
-    "code_galaxy": {
-        "gemini": (
-            "Create a cosmic galaxy visualization where stars and nebulae "
-            "represent programming skills for a {archetype_name}. "
-            "Colors: {colors}. Each constellation maps to: {top_skills}. "
-            "Style: {style}. 1584x396. No text, no faces."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "cosmic galaxy nebula, constellation art, programming universe, "
-                "{style} style, {colors} nebula colors, space background, "
-                "stars as code, {top_skills} constellations, "
-                "high quality, 4k, beautiful, ethereal"
-            ),
-            "negative": (
-                "text, words, face, person, planet earth, spaceship, "
-                "low quality, blurry, watermark, cartoon"
-            ),
-        },
-        "flux": (
-            "Code galaxy banner. Cosmic nebulae as {top_skills}. "
-            "{colors} palette. {style}. Constellations. Dark space. "
-            "No text. No faces."
-        ),
-        "tier": "pro",
-    },
-    "isometric_workspace": {
-        "gemini": (
-            "Create an isometric 3D illustration of a developer workspace "
-            "for a {archetype_name}. Include stylized monitors showing "
-            "code in {top_skills}. Color palette: {colors}. "
-            "Style: {style}. Low-poly aesthetic. 1584x396. No faces."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "isometric 3D workspace, developer desk, low poly art, "
-                "monitors with code, {style} style, {colors} palette, "
-                "{top_skills} themed objects, clean design, "
-                "high quality, 4k, detailed miniature"
-            ),
-            "negative": (
-                "text, words, face, person photo, realistic, messy, "
-                "low quality, blurry, watermark, cluttered"
-            ),
-        },
-        "flux": (
-            "Isometric developer workspace. Low-poly 3D. {top_skills} themed. "
-            "{colors}. {style}. Monitors and code. No faces. Clean."
-        ),
-        "tier": "pro",
-    },
-    "gradient_mesh": {
-        "gemini": (
-            "Create an abstract gradient mesh banner with flowing curves "
-            "and layered depth for a {archetype_name}. "
-            "Colors: {colors}. Inspired by: {top_skills}. "
-            "Style: {style}. Smooth, modern, Apple-tier design. "
-            "1584x396. No text, no faces."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "abstract gradient mesh, flowing curves, layered depth, "
-                "modern design, {style} style, {colors} gradients, "
-                "smooth transitions, Apple aesthetic, premium, "
-                "high quality, 4k, beautiful, elegant"
-            ),
-            "negative": (
-                "text, words, face, person, sharp edges, pixelated, "
-                "low quality, blurry, watermark, busy"
-            ),
-        },
-        "flux": (
-            "Abstract gradient mesh banner. Flowing curves. {colors}. "
-            "{style}. Modern, premium. Smooth depth layers. "
-            "No text. No faces."
-        ),
-        "tier": "pro",
-    },
-    "terminal_retro": {
-        "gemini": (
-            "Create a retro terminal/CRT screen aesthetic banner for a "
-            "{archetype_name}. Green-on-black or {colors} phosphor glow. "
-            "Matrix-style cascading symbols for: {top_skills}. "
-            "Style: {style}. Scanlines, CRT curve. 1584x396. No faces."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "retro CRT terminal, green phosphor glow, matrix rain, "
-                "hacker aesthetic, {style} style, {colors} on black, "
-                "scanlines, vintage computer, {top_skills} symbols, "
-                "high quality, 4k, atmospheric, moody"
-            ),
-            "negative": (
-                "face, person, modern UI, color photo, realistic, "
-                "low quality, blurry, watermark, bright colorful"
-            ),
-        },
-        "flux": (
-            "Retro CRT terminal banner. {colors} phosphor on black. "
-            "Matrix-style {top_skills} symbols. {style}. "
-            "Scanlines. Vintage. No faces."
-        ),
-        "tier": "pro",
-    },
-    "hexagonal_grid": {
-        "gemini": (
-            "Create a hexagonal grid/honeycomb pattern banner for a "
-            "{archetype_name}. Each hex cell contains an icon for: "
-            "{top_skills}. Color scheme: {colors}. Style: {style}. "
-            "Dark background, subtle glow. 1584x396. No text, no faces."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "hexagonal grid, honeycomb pattern, tech icons, "
-                "{style} style, {colors} palette, dark background, "
-                "subtle glow, {top_skills} icons in hexagons, "
-                "high quality, 4k, geometric, precise"
-            ),
-            "negative": (
-                "text, words, face, person, organic shapes, low quality, blurry, watermark, messy"
-            ),
-        },
-        "flux": (
-            "Hexagonal grid banner. Honeycomb with {top_skills} icons. "
-            "{colors}. {style}. Dark, glowing edges. "
-            "No text. No faces."
-        ),
-        "tier": "pro",
-    },
-    "data_flow": {
-        "gemini": (
-            "Create a data flow / pipeline visualization banner for a "
-            "{archetype_name}. Abstract data streams connecting nodes "
-            "representing: {top_skills}. Colors: {colors}. "
-            "Style: {style}. Network topology aesthetic. "
-            "1584x396. No text, no faces."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "data flow visualization, network nodes, pipeline art, "
-                "{style} style, {colors} data streams, dark background, "
-                "connecting lines, {top_skills} node icons, "
-                "high quality, 4k, technical, elegant"
-            ),
-            "negative": (
-                "text, words, face, person, chart labels, axis numbers, "
-                "low quality, blurry, watermark, simple"
-            ),
-        },
-        "flux": (
-            "Data flow pipeline banner. Network nodes for {top_skills}. "
-            "{colors} streams. {style}. Abstract topology. "
-            "No text. No faces."
-        ),
-        "tier": "pro",
-    },
-    "topographic": {
-        "gemini": (
-            "Create a topographic contour map style banner for a "
-            "{archetype_name}. Elevation lines form abstract shapes "
-            "suggesting: {top_skills}. Colors: {colors}. "
-            "Style: {style}. Geographic art meets tech. "
-            "1584x396. No text, no faces."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "topographic contour map, elevation lines, geographic art, "
-                "{style} style, {colors} lines on dark, "
-                "abstract landscape, {top_skills} terrain shapes, "
-                "high quality, 4k, detailed linework, elegant"
-            ),
-            "negative": (
-                "text, words, face, person, real photo, satellite, "
-                "low quality, blurry, watermark, colorful"
-            ),
-        },
-        "flux": (
-            "Topographic contour banner. Abstract elevation lines. "
-            "{colors} on dark. {top_skills} shapes. {style}. "
-            "Geographic. No text. No faces."
-        ),
-        "tier": "pro",
-    },
-    "blueprint": {
-        "gemini": (
-            "Create a technical blueprint style banner for a "
-            "{archetype_name}. White/light lines on blue grid background. "
-            "Schematics of: {top_skills}. Colors: {colors}. "
-            "Style: {style}. Engineering drawing aesthetic. "
-            "1584x396. No faces."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "technical blueprint, engineering drawing, white lines on blue, "
-                "{style} style, grid background, {colors} accents, "
-                "schematics for {top_skills}, design document, "
-                "high quality, 4k, precise, technical"
-            ),
-            "negative": (
-                "face, person, photo, realistic, messy handwriting, "
-                "low quality, blurry, watermark, colorful art"
-            ),
-        },
-        "flux": (
-            "Blueprint banner. White lines on blue grid. "
-            "{top_skills} schematics. {colors} accents. {style}. "
-            "Engineering drawing. No faces."
-        ),
-        "tier": "pro",
-    },
-    "particle_wave": {
-        "gemini": (
-            "Create a particle wave / audio waveform inspired banner for a "
-            "{archetype_name}. Dynamic particles forming waves that represent: "
-            "{top_skills}. Colors: {colors}. Style: {style}. "
-            "Motion blur, energy visualization. 1584x396. No text, no faces."
-        ),
-        "stable_diffusion": {
-            "positive": (
-                "particle wave, audio waveform art, dynamic particles, "
-                "{style} style, {colors} particle glow, dark background, "
-                "energy visualization, {top_skills} wave patterns, "
-                "high quality, 4k, motion blur, vivid"
-            ),
-            "negative": (
-                "text, words, face, person, static, flat, low quality, blurry, watermark, simple"
-            ),
-        },
-        "flux": (
-            "Particle wave banner. Dynamic energy particles. "
-            "{colors} glow. {top_skills} wave patterns. {style}. "
-            "Motion. Dark background. No text. No faces."
-        ),
-        "tier": "pro",
-    },
+    Templates without placeholders skip ``str.format`` entirely and return
+    the (interned) template itself. Templates with plain ``{name}`` fields
+    are turned into a generated f-string function, so rendering is a single
+    string build with no format-string parsing. Anything fancier (format
+    specs, conversions, attribute access) keeps using ``str.format``.
+    """
+    if "{" not in template:
+
+        def _constant(**_fields: Any) -> str:
+            return template
+
+        return _constant
+
+    pieces: list[str] = []
+    names: list[str] = []
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        if literal:
+            pieces.append(repr(literal))
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier() or keyword.iskeyword(field):
+            return template.format
+        pieces.append(f"f'{{{field}}}'")
+        if field not in names:
+            names.append(field)
+
+    source = f"def _render(*, {', '.join(names)}, **_unused):\n    return ({' '.join(pieces)})\n"
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "<prompt-template>", "exec"), namespace)  # noqa: S102
+    return namespace["_render"]
+
+
+_ImageBuilder = Callable[..., str | SDPrompt]
+
+
+def _compile_image_template(template: str | Mapping[str, str]) -> _ImageBuilder:
+    """Compile an image template into a builder returning the final prompt shape.
+
+    The SD-vs-plain decision is made here, once, rather than on every render.
+    """
+    if isinstance(template, Mapping):
+        positive = _compile_template(template["positive"])
+        negative = _compile_template(template["negative"])
+
+        def _build_sd(**fields: Any) -> SDPrompt:
+            return SDPrompt(positive=positive(**fields), negative=negative(**fields))
+
+        return _build_sd
+    return _compile_template(template)
+
+
+# Flat (template_id, model_type) -> compiled builder with per-set fallbacks resolved
+_IMAGE_MODELS = ("gemini", "stable_diffusion", "flux")
+_IMAGE_INDEX: dict[tuple[str, str], _ImageBuilder] = {
+    (template_id, model): _compile_image_template(template_set.get(model, template_set["gemini"]))
+    for template_id, template_set in IMAGE_TEMPLATES.items()
+    for model in _IMAGE_MODELS
 }
 
-# Template tier classification
-FREE_TEMPLATES = {k for k, v in IMAGE_TEMPLATES.items() if v.get("tier") == "free"}
-PRO_TEMPLATES = {k for k, v in IMAGE_TEMPLATES.items() if v.get("tier") == "pro"}
-ALL_TEMPLATES = FREE_TEMPLATES | PRO_TEMPLATES
 
+def _resolve_image_template(template_id: str, model_type: str) -> _ImageBuilder:
+    """Look up a compiled image builder, falling back to portfolio_banner / gemini."""
+    template = _IMAGE_INDEX.get((template_id, model_type))
+    if template is not None:
+        return template
+    if template_id not in IMAGE_TEMPLATES:
+        template_id = "portfolio_banner"
+    return _IMAGE_INDEX.get((template_id, model_type)) or _IMAGE_INDEX[(template_id, "gemini")]
 
-class PromptOrchestrator:
-    """Context Engineering pipeline for AI model prompts."""
 
-    def build_readme_prompt(
-        self,
-        scoring_result: dict[str, Any],
-        profile: dict[str, Any],
-        style: str = "professional",
-        career_goal: str | None = None,
-    ) -> dict[str, str]:
-        """Build a README generation prompt from scoring and profile data.
+# Compiled README user-prompt suffix renderers, keyed by style
+_README_RENDERERS: dict[str, Callable[..., str]] = {
+    style: _compile_template(template["user_suffix"])
+    for style, template in README_TEMPLATES.items()
+}
 
-        Returns:
-            Dict with 'system' and 'user' keys for model prompt.
-        """
-        template = README_TEMPLATES.get(style, README_TEMPLATES["professional"])
-        tech_profile = scoring_result.get("tech_profile", {})
-        scores = scoring_result.get("scores", {})
-        archetype = scoring_result.get("archetype", {})
-
-        # Context retrieval: extract most relevant data
-        top_languages = ", ".join(l["name"] for l in tech_profile.get("languages", [])[:5])
-        frameworks = ", ".join(tech_profile.get("frameworks", [])[:8])
-        top_repos = "; ".join(
-            f"{r['name']} ({r.get('language', 'N/A')}, {r.get('stars', 0)} stars)"
-            for r in tech_profile.get("top_repos", [])[:3]
-        )
+# Template tier classification: id -> "free" | "pro"
+_IMAGE_TIER = MappingProxyType({k: v["tier"] for k, v in IMAGE_TEMPLATES.items()})
+_README_TIER = MappingProxyType({k: v["tier"] for k, v in README_TEMPLATES.items()})
+_PRO_TIERS = frozenset({"pro", "enterprise"})
 
-        career_goal_section = ""
-        if career_goal:
-            career_goal_section = f"- Career Goal: {career_goal}\n"
-
-        # Context processing: format for model
-        user_prompt = template["user"].format(
-            archetype_name=archetype.get("name", "Developer"),
-            archetype_description=archetype.get("description", ""),
-            top_languages=top_languages or "Not specified",
-            frameworks=frameworks or "Not specified",
-            activity_score=scores.get("activity", 0),
-            collab_score=scores.get("collaboration", 0),
-            diversity_score=scores.get("stack_diversity", 0),
-            ai_score=scores.get("ai_savviness", 0),
-            top_repos=top_repos or "Not specified",
-            career_goal_section=career_goal_section,
-            style=style,
+FREE_TEMPLATES = frozenset(k for k, t in _IMAGE_TIER.items() if t == "free")
+PRO_TEMPLATES = frozenset(k for k, t in _IMAGE_TIER.items() if t == "pro")
+ALL_TEMPLATES = FREE_TEMPLATES | PRO_TEMPLATES
+_FREE_README_STYLES = frozenset(k for k, t in _README_TIER.items() if t == "free")
+_ALL_README_STYLES = frozenset(_README_TIER)
+
+# Tier listings are fixed at import, so sort them once
+_SORTED_FREE = tuple(sorted(FREE_TEMPLATES))
+_SORTED_ALL = tuple(sorted(ALL_TEMPLATES))
+_SORTED_README_FREE = tuple(sorted(_FREE_README_STYLES))
+_SORTED_README_ALL = tuple(sorted(_ALL_README_STYLES))
+
+
+# Shared fallback values for prompt fields
+_NOT_SPECIFIED = sys.intern("Not specified")
+_DEFAULT_COLORS = sys.intern("#0D1117, #58A6FF, #238636")
+
+# Shared read-only defaults for missing scoring-result sections
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_SEQUENCE: tuple[Any, ...] = ()
+
+
+class _PromptFields(NamedTuple):
+    """Profile values used by prompt templates, joined into display strings once.
+
+    Built once per scoring result and shared by every README and image
+    variant rendered from it.
+    """
+
+    archetype_name: str
+    archetype_description: str
+    top_languages: str  # top 5 languages
+    top_skills: str  # top 3 languages, for image prompts
+    frameworks: str
+    activity_score: Any
+    collab_score: Any
+    diversity_score: Any
+    ai_score: Any
+    top_repos: str
+
+
+def _prompt_fields(scoring_result: dict[str, Any]) -> _PromptFields:
+    """Extract and pre-join the prompt fields of a scoring result."""
+    tech_profile = scoring_result.get("tech_profile", _EMPTY_MAPPING)
+    scores_get = scoring_result.get("scores", _EMPTY_MAPPING).get
+    arch_get = scoring_result.get("archetype", _EMPTY_MAPPING).get
+    tech_get = tech_profile.get
+    languages = [l["name"] for l in (tech_get("languages") or _EMPTY_SEQUENCE)[:5]]
+    repos = (tech_get("top_repos") or _EMPTY_SEQUENCE)[:3]
+    frameworks = sorted((tech_get("frameworks") or _EMPTY_SEQUENCE)[:8])
+
+    # Context retrieval: extract most relevant data
+    return _PromptFields(
+        archetype_name=arch_get("name", "Developer"),
+        archetype_description=arch_get("description", ""),
+        top_languages=", ".join(languages) or _NOT_SPECIFIED,
+        top_skills=", ".join(languages[:3]),
+        frameworks=", ".join(frameworks) or _NOT_SPECIFIED,
+        activity_score=scores_get("activity", 0),
+        collab_score=scores_get("collaboration", 0),
+        diversity_score=scores_get("stack_diversity", 0),
+        ai_score=scores_get("ai_savviness", 0),
+        top_repos="; ".join(
+            [f"{r['name']} ({r.get('language', 'N/A')}, {r.get('stars', 0)} stars)" for r in repos]
+        )
+        or _NOT_SPECIFIED,
+    )
+
+
+def _readme_key(fields: _PromptFields, style: str, career_goal: str | None) -> tuple[Any, ...]:
+    """Hashable cache key for a README render."""
+    return (
+        style,
+        career_goal,
+        fields.archetype_name,
+        fields.archetype_description,
+        fields.top_languages,
+        fields.frameworks,
+        fields.activity_score,
+        fields.collab_score,
+        fields.diversity_score,
+        fields.ai_score,
+        fields.top_repos,
+    )
+
+
+def _image_key(
+    fields: _PromptFields, template_id: str, model_type: str, style: str, colors: str | None
+) -> tuple[Any, ...]:
+    """Hashable cache key for an image render."""
+    return (template_id, model_type, style, colors, fields.archetype_name, fields.top_skills)
+
+
+@lru_cache(maxsize=2048)
+def _render_readme(key: tuple[Any, ...]) -> ReadmePrompt:
+    """Render a README prompt from a hashable prompt key.
+
+    The result is immutable, so cache hits are returned as-is.
+    """
+    (
+        style,
+        career_goal,
+        archetype_name,
+        archetype_description,
+        top_languages,
+        frameworks,
+        activity_score,
+        collab_score,
+        diversity_score,
+        ai_score,
+        top_repos,
+    ) = key
+    style_key = style if style in README_TEMPLATES else "professional"
+
+    career_goal_section = ""
+    if career_goal:
+        career_goal_section = f"- Career Goal: {career_goal}\n"
+
+    # Context processing: static instructions first, then the profile data
+    template = README_TEMPLATES[style_key]
+    prefix = template["user_prefix"]
+    suffix = _README_RENDERERS[style_key](
+        archetype_name=archetype_name,
+        archetype_description=archetype_description,
+        top_languages=top_languages,
+        frameworks=frameworks,
+        activity_score=activity_score,
+        collab_score=collab_score,
+        diversity_score=diversity_score,
+        ai_score=ai_score,
+        top_repos=top_repos,
+        career_goal_section=career_goal_section,
+        style=style,
+    )
+    return ReadmePrompt(template["system"], prefix + suffix, prefix, suffix)
+
+
+@lru_cache(maxsize=2048)
+def _render_image(key: tuple[Any, ...]) -> str | SDPrompt:
+    """Render an image prompt from a hashable prompt key.
+
+    Returns:
+        Prompt string (gemini/flux) or read-only SDPrompt (SD).
+    """
+    template_id, model_type, style, colors, archetype_name, top_skills = key
+    return _resolve_image_template(template_id, model_type)(
+        archetype_name=archetype_name,
+        top_skills=top_skills,
+        style=style,
+        colors=colors or _DEFAULT_COLORS,
+    )
+
+
+def _build_readme_prompt(
+    scoring_result: dict[str, Any],
+    profile: dict[str, Any],
+    style: str = "professional",
+    career_goal: str | None = None,
+) -> ReadmePrompt:
+    """Build a README generation prompt from scoring and profile data.
+
+    Returns:
+        ReadmePrompt with 'system' and 'user' prompt strings.
+    """
+    return _render_readme(_readme_key(_prompt_fields(scoring_result), style, career_goal))
+
+
+def _build_image_prompt(
+    scoring_result: dict[str, Any],
+    template_id: str = "portfolio_banner",
+    model_type: str = "gemini",
+    style: str = "minimal",
+    colors: list[str] | None = None,
+) -> str | SDPrompt:
+    """Build an image generation prompt.
+
+    Args:
+        scoring_result: Profile scoring data
+        template_id: Image template to use
+        model_type: Target model (gemini, stable_diffusion, flux)
+        style: Visual style
+        colors: Color palette hex codes
+
+    Returns:
+        Prompt string (gemini/flux) or read-only SDPrompt dict with
+        positive/negative (SD)
+    """
+    palette = ", ".join(colors) if colors else None
+    key = _image_key(_prompt_fields(scoring_result), template_id, model_type, style, palette)
+    return _render_image(key)
+
+
+def _build_bundle(
+    scoring_result: dict[str, Any],
+    readme_styles: list[str],
+    image_specs: list[tuple[str, str]],
+    career_goal: str | None = None,
+    colors: list[str] | None = None,
+    image_style: str = "minimal",
+) -> dict[str, Any]:
+    """Build several README and image prompts for one profile.
+
+    The profile fields are extracted once and shared by every variant,
+    instead of re-walking the scoring result per prompt.
+
+    Args:
+        scoring_result: Profile scoring data
+        readme_styles: README styles to render
+        image_specs: (template_id, model_type) pairs to render
+        career_goal: Optional career goal for README prompts
+        colors: Color palette hex codes for image prompts
+        image_style: Visual style for image prompts
+
+    Returns:
+        Dict with 'readmes' (style -> ReadmePrompt) and
+        'images' ((template_id, model_type) -> prompt).
+    """
+    fields = _prompt_fields(scoring_result)
+    palette = ", ".join(colors) if colors else None
+
+    readmes = {
+        style: _render_readme(_readme_key(fields, style, career_goal)) for style in readme_styles
+    }
+    images = {
+        (template_id, model_type): _render_image(
+            _image_key(fields, template_id, model_type, image_style, palette)
         )
+        for template_id, model_type in image_specs
+    }
+    return {"readmes": readmes, "images": images}
 
-        return {
-            "system": template["system"],
-            "user": user_prompt,
-        }
-
-    def build_image_prompt(
-        self,
-        scoring_result: dict[str, Any],
-        template_id: str = "portfolio_banner",
-        model_type: str = "gemini",
-        style: str = "minimal",
-        colors: list[str] | None = None,
-    ) -> str | dict[str, str]:
-        """Build an image generation prompt.
 
-        Args:
-            scoring_result: Profile scoring data
-            template_id: Image template to use
-            model_type: Target model (gemini, stable_diffusion, flux)
-            style: Visual style
-            colors: Color palette hex codes
+class PromptOrchestrator:
+    """Context Engineering pipeline for AI model prompts.
 
-        Returns:
-            Prompt string (gemini/flux) or dict with positive/negative (SD)
-        """
-        template_set = IMAGE_TEMPLATES.get(template_id, IMAGE_TEMPLATES["portfolio_banner"])
-        template = template_set.get(model_type, template_set.get("gemini", ""))
-
-        tech_profile = scoring_result.get("tech_profile", {})
-        archetype = scoring_result.get("archetype", {})
-
-        top_skills = ", ".join(l["name"] for l in tech_profile.get("languages", [])[:3])
-        color_str = ", ".join(colors) if colors else "#0D1117, #58A6FF, #238636"
-
-        if isinstance(template, dict):
-            # Stable Diffusion format
-            return {
-                "positive": template["positive"].format(
-                    archetype_name=archetype.get("name", "Developer"),
-                    top_skills=top_skills,
-                    style=style,
-                    colors=color_str,
-                ),
-                "negative": template["negative"],
-            }
-        return template.format(
-            archetype_name=archetype.get("name", "Developer"),
-            top_skills=top_skills,
-            style=style,
-            colors=color_str,
-        )
+    Stateless: the prompt builders are module-level functions exposed as
+    static methods, and callers share the module-level ``orchestrator``.
+    """
+
+    __slots__ = ()
+
+    build_readme_prompt = staticmethod(_build_readme_prompt)
+    build_image_prompt = staticmethod(_build_image_prompt)
+    build_bundle = staticmethod(_build_bundle)
 
     @staticmethod
-    def get_available_templates(tier: str = "free") -> list[str]:
+    def get_available_templates(tier: str = "free") -> tuple[str, ...]:
         """Get template IDs available for a given tier.
 
         Args:
             tier: 'free', 'pro', or 'enterprise'
 
         Returns:
-            List of available template IDs.
+            Sorted tuple of available template IDs.
         """
-        if tier in ("pro", "enterprise"):
-            return sorted(ALL_TEMPLATES)
-        return sorted(FREE_TEMPLATES)
+        if tier in _PRO_TIERS:
+            return _SORTED_ALL
+        return _SORTED_FREE
 
     @staticmethod
-    def get_available_readme_styles(tier: str = "free") -> list[str]:
+    def get_available_readme_styles(tier: str = "free") -> tuple[str, ...]:
         """Get README style names available for a given tier."""
-        if tier in ("pro", "enterprise"):
-            return sorted(README_TEMPLATES.keys())
-        return [
-            k for k in sorted(README_TEMPLATES.keys()) if README_TEMPLATES[k].get("tier") == "free"
-        ]
+        if tier in _PRO_TIERS:
+            return _SORTED_README_ALL
+        return _SORTED_README_FREE
 
     @staticmethod
     def is_template_allowed(template_id: str, tier: str) -> bool:
         """Check if a template is allowed for the given tier."""
-        if tier in ("pro", "enterprise"):
-            return template_id in ALL_TEMPLATES
-        return template_id in FREE_TEMPLATES
+        return template_id in (ALL_TEMPLATES if tier in _PRO_TIERS else FREE_TEMPLATES)
 
     @staticmethod
     def is_readme_style_allowed(style: str, tier: str) -> bool:
         """Check if a README style is allowed for the given tier."""
-        if tier in ("pro", "enterprise"):
-            return style in README_TEMPLATES
-        template = README_TEMPLATES.get(style)
-        return template is not None and template.get("tier") == "free"
+        return style in (_ALL_README_STYLES if tier in _PRO_TIERS else _FREE_README_STYLES)
+
+
+# Module-level singleton
+orchestrator = PromptOrchestrator()
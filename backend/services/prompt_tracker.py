@@ -10,34 +10,88 @@ Usage:
     tracker.log_prompt(run_id, prompt_dict)
     tracker.log_result(run_id, quality_score, latency, model_used)
     tracker.end_run(run_id)
+    tracker.flush()  # on shutdown: wait for queued MLflow writes
 """
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
+import queue
+import secrets
+import threading
 import time
-from typing import Any
+from typing import Any, NamedTuple
 
 from app.config import get_settings
 from app.logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Runs that are never ended (caller crashed, forgot end_run) are reaped
+_RUN_TTL_SECONDS = 3600
+_MAX_ACTIVE_RUNS = 10_000
+
+# Best-prompt-version lookups change slowly; cache them briefly
+_BEST_VERSION_TTL_SECONDS = 60
+_BEST_VERSION_CACHE_SIZE = 256
+
+# MLflow search filter, bound per (template_id, model_provider) lookup
+_BEST_VERSION_FILTER = "tags.template_id = '{}' AND tags.model_provider = '{}'"
+
+
+def _serialize_prompt(prompt: dict[str, str] | str) -> bytes:
+    """Serialize a prompt to canonical UTF-8 JSON (sorted keys, compact).
+
+    Uses orjson when installed; the stdlib fallback is configured to emit
+    the same bytes so prompt hashes don't depend on which one is present.
+    """
+    if isinstance(prompt, str):
+        return prompt.encode()
+    if orjson is not None:
+        return orjson.dumps(prompt, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(prompt, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class _PendingWrite(NamedTuple):
+    """An MLflow write queued for the background worker."""
+
+    run_id: str
+    metrics: dict[str, float] | None = None
+    params: dict[str, str] | None = None
+    artifact: tuple[str, str] | None = None  # (artifact_file, text)
+    status: str | None = None
+
 
 class PromptTracker:
     """Track prompt versions, generation experiments, and quality metrics.
 
     Uses MLflow to log experiment runs. Falls back gracefully if MLflow
     is not available (logs warning, continues without tracking).
+
+    Run creation is synchronous (the caller needs the run ID), but params,
+    metrics, prompt artifacts and run termination are queued and written by
+    a daemon thread, coalesced per run. Starting that thread registers
+    ``flush()`` with atexit, so writes still queued at exit are sent.
     """
 
     def __init__(self, mlflow_uri: str | None = None) -> None:
         self._mlflow_uri = mlflow_uri
         self._mlflow = None
+        self._client: Any = None
         self._experiment_id: str | None = None
         self._active_runs: dict[str, Any] = {}
         self._initialized = False
+        self._queue: queue.Queue[_PendingWrite | threading.Event] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+        self._best_versions: dict[tuple[str, str, str], tuple[float, str | None]] = {}
 
     def _ensure_initialized(self) -> bool:
         """Lazy-initialize MLflow connection.
@@ -56,6 +110,7 @@ class PromptTracker:
             mlflow.set_tracking_uri(uri)
             mlflow.set_experiment("gps-prompt-versioning")
             self._mlflow = mlflow
+            self._client = mlflow.tracking.MlflowClient(tracking_uri=uri)
             self._experiment_id = mlflow.get_experiment_by_name(
                 "gps-prompt-versioning"
             ).experiment_id
@@ -66,6 +121,118 @@ class PromptTracker:
             self._mlflow = None
             return False
 
+    def _get_client(self) -> Any:
+        """Return the cached MlflowClient, creating it on first use."""
+        if self._client is None:
+            self._client = self._mlflow.tracking.MlflowClient()
+        return self._client
+
+    def _log_batch(
+        self,
+        run_id: str,
+        metrics: dict[str, float] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> None:
+        """Send metrics and params for a run in a single log_batch request."""
+        entities = self._mlflow.entities
+        timestamp = time.time_ns() // 1_000_000
+        self._get_client().log_batch(
+            run_id,
+            metrics=[entities.Metric(k, v, timestamp, 0) for k, v in (metrics or {}).items()],
+            params=[entities.Param(k, v) for k, v in (params or {}).items()],
+        )
+
+    def _enqueue(self, write: _PendingWrite) -> None:
+        """Hand an MLflow write to the background worker, starting it if needed."""
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._drain_queue, name="mlflow-writer", daemon=True
+                    )
+                    self._worker.start()
+                    # The daemon thread dies with the process; drain it first
+                    atexit.register(self.flush)
+        self._queue.put(write)
+
+    def _drain_queue(self) -> None:
+        """Worker loop: take everything queued so far and write it in one pass."""
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_pending(items)
+
+    def _write_pending(self, items: list[_PendingWrite | threading.Event]) -> None:
+        """Coalesce queued writes by run and send one log_batch per run."""
+        runs: dict[str, dict[str, Any]] = {}
+        flushed: list[threading.Event] = []
+        for item in items:
+            if isinstance(item, threading.Event):
+                flushed.append(item)
+                continue
+            run = runs.setdefault(
+                item.run_id, {"metrics": {}, "params": {}, "artifacts": [], "status": None}
+            )
+            run["metrics"].update(item.metrics or {})
+            run["params"].update(item.params or {})
+            if item.artifact:
+                run["artifacts"].append(item.artifact)
+            if item.status:
+                run["status"] = item.status
+
+        for run_id, run in runs.items():
+            try:
+                client = self._get_client()
+                if run["metrics"] or run["params"]:
+                    self._log_batch(run_id, metrics=run["metrics"], params=run["params"])
+                for artifact_file, text in run["artifacts"]:
+                    client.log_text(run_id, text, artifact_file)
+                if run["status"]:
+                    client.set_terminated(run_id, status=run["status"])
+            except Exception as e:
+                logger.warning("mlflow_write_failed", run_id=run_id, error=str(e))
+
+        for event in flushed:
+            event.set()
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until all queued MLflow writes have been sent.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if the queue drained in time, False on timeout.
+        """
+        if self._worker is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _reap_stale_runs(self) -> None:
+        """Drop runs that were never ended: older than the TTL or over the cap.
+
+        Runs are inserted in start order, so stale entries are always at the
+        front of the dict. Abandoned MLflow runs are marked KILLED.
+        """
+        runs = self._active_runs
+        cutoff = time.perf_counter() - _RUN_TTL_SECONDS
+        while runs:
+            run_id = next(iter(runs))
+            run_info = runs[run_id]
+            if run_info["start_time"] > cutoff and len(runs) < _MAX_ACTIVE_RUNS:
+                return
+            if runs.pop(run_id, None) is None:
+                continue
+            if run_info.get("mlflow") and self._mlflow:
+                self._enqueue(_PendingWrite(run_id, status="KILLED"))
+            logger.warning("generation_run_abandoned", run_id=run_id)
+
     def start_generation_run(
         self,
         template_id: str,
@@ -91,18 +258,17 @@ class PromptTracker:
             "model_provider": model_provider,
             "archetype": archetype,
             "tier": tier,
-            **(tags or {}),
         }
+        if tags:
+            run_tags |= tags
+        self._reap_stale_runs()
 
         if self._ensure_initialized() and self._mlflow:
             try:
-                run = self._mlflow.start_run(
-                    experiment_id=self._experiment_id,
-                    tags=run_tags,
-                )
+                run = self._get_client().create_run(self._experiment_id, tags=run_tags)
                 run_id = run.info.run_id
                 self._active_runs[run_id] = {
-                    "start_time": time.time(),
+                    "start_time": time.perf_counter(),
                     "mlflow": True,
                 }
                 logger.info("mlflow_run_started", run_id=run_id)
@@ -111,11 +277,9 @@ class PromptTracker:
                 logger.warning("mlflow_start_run_failed", error=str(e))
 
         # Fallback: local tracking without MLflow
-        fallback_id = hashlib.sha256(
-            f"{template_id}:{model_provider}:{time.time()}".encode()
-        ).hexdigest()[:16]
+        fallback_id = secrets.token_hex(8)
         self._active_runs[fallback_id] = {
-            "start_time": time.time(),
+            "start_time": time.perf_counter(),
             "mlflow": False,
             "tags": run_tags,
         }
@@ -139,30 +303,20 @@ class PromptTracker:
             return
 
         # Compute prompt hash for deduplication / version tracking
-        prompt_str = json.dumps(prompt, sort_keys=True) if isinstance(prompt, dict) else prompt
-        prompt_hash = hashlib.sha256(prompt_str.encode()).hexdigest()[:12]
+        prompt_bytes = _serialize_prompt(prompt)
+        prompt_hash = hashlib.blake2b(prompt_bytes, digest_size=6).hexdigest()
 
         if run_info.get("mlflow") and self._mlflow:
-            try:
-                self._mlflow.log_param("prompt_hash", prompt_hash)
-                if prompt_version:
-                    self._mlflow.log_param("prompt_version", prompt_version)
-                # Log prompt as artifact (text file)
-                import os
-                import tempfile
-
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".txt", delete=False, prefix="prompt_"
-                ) as f:
-                    f.write(prompt_str)
-                    temp_path = f.name
-
-                try:
-                    self._mlflow.log_artifact(temp_path, "prompts")
-                finally:
-                    os.unlink(temp_path)
-            except Exception as e:
-                logger.warning("mlflow_log_prompt_failed", error=str(e))
+            params = {"prompt_hash": prompt_hash}
+            if prompt_version:
+                params["prompt_version"] = prompt_version
+            self._enqueue(
+                _PendingWrite(
+                    run_id,
+                    params=params,
+                    artifact=(f"prompts/prompt_{prompt_hash}.txt", prompt_bytes.decode()),
+                )
+            )
         else:
             run_info["prompt_hash"] = prompt_hash
 
@@ -198,11 +352,7 @@ class PromptTracker:
             metrics["quality_score"] = quality_score
 
         if run_info.get("mlflow") and self._mlflow:
-            try:
-                self._mlflow.log_param("model_used", model_used)
-                self._mlflow.log_metrics(metrics)
-            except Exception as e:
-                logger.warning("mlflow_log_result_failed", error=str(e))
+            self._enqueue(_PendingWrite(run_id, metrics=metrics, params={"model_used": model_used}))
         else:
             run_info["metrics"] = metrics
             run_info["model_used"] = model_used
@@ -218,14 +368,12 @@ class PromptTracker:
         if not run_info:
             return
 
-        total_time = time.time() - run_info["start_time"]
+        total_time = time.perf_counter() - run_info["start_time"]
 
         if run_info.get("mlflow") and self._mlflow:
-            try:
-                self._mlflow.log_metric("total_time_seconds", total_time)
-                self._mlflow.end_run(status=status)
-            except Exception as e:
-                logger.warning("mlflow_end_run_failed", error=str(e))
+            self._enqueue(
+                _PendingWrite(run_id, metrics={"total_time_seconds": total_time}, status=status)
+            )
 
         logger.info(
             "generation_run_completed",
@@ -242,6 +390,9 @@ class PromptTracker:
     ) -> str | None:
         """Query MLflow for the best-performing prompt version.
 
+        Successful lookups are cached per (template, provider, metric) for
+        60 seconds; failed queries are not cached.
+
         Args:
             template_id: Template to query.
             model_provider: Provider to query.
@@ -253,26 +404,31 @@ class PromptTracker:
         if not self._ensure_initialized() or not self._mlflow:
             return None
 
-        try:
-            from mlflow.tracking import MlflowClient
+        key = (template_id, model_provider, metric)
+        now = time.perf_counter()
+        cached = self._best_versions.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
 
-            client = MlflowClient()
-            runs = client.search_runs(
+        try:
+            runs = self._get_client().search_runs(
                 experiment_ids=[self._experiment_id],
-                filter_string=(
-                    f"tags.template_id = '{template_id}' "
-                    f"AND tags.model_provider = '{model_provider}'"
-                ),
+                filter_string=_BEST_VERSION_FILTER.format(template_id, model_provider),
                 order_by=[f"metrics.{metric} DESC"],
                 max_results=1,
             )
-            if runs:
-                return runs[0].data.params.get("prompt_version")
-            return None
         except Exception as e:
             logger.warning("mlflow_query_failed", error=str(e))
             return None
 
+        version = runs[0].data.params.get("prompt_version") if runs else None
+        self._best_versions.pop(key, None)
+        if len(self._best_versions) >= _BEST_VERSION_CACHE_SIZE:
+            # Entries are inserted in expiry order; drop the oldest
+            self._best_versions.pop(next(iter(self._best_versions)), None)
+        self._best_versions[key] = (now + _BEST_VERSION_TTL_SECONDS, version)
+        return version
+
 
 # Module-level singleton
 _tracker: PromptTracker | None = None
@@ -17,10 +17,22 @@ is persisted to PostgreSQL for trend analytics.
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import heapq
+import json
 import math
 import re
+import sys
+import time
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable
 from datetime import UTC, datetime
-from typing import Any
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
+from typing import Any, NamedTuple
 
 from app.logging_config import get_logger
 from app.metrics import ARCHETYPES_ASSIGNED, SCORING_DURATION
@@ -28,7 +40,18 @@ from services.commit_analyzer import CommitAnalysisResult, CommitAnalyzer
 
 logger = get_logger(__name__)
 
-# AI-related patterns in commit messages
+# AI-related patterns in commit messages, one per signal
+AI_COMMIT_SIGNAL_NAMES = (
+    "copilot",
+    "gpt",
+    "gemini",
+    "claude",
+    "generated",
+    "assisted",
+    "tools",
+    "bot",
+    "copilot_ca",
+)
 AI_COMMIT_PATTERNS = [
     re.compile(r"copilot", re.IGNORECASE),
     re.compile(r"chatgpt|chat-gpt|gpt-4|gpt-3", re.IGNORECASE),
@@ -41,19 +64,108 @@ AI_COMMIT_PATTERNS = [
     re.compile(r"co-authored-by:.*copilot", re.IGNORECASE),
 ]
 
-# AI config files that indicate AI tool usage
-AI_CONFIG_FILES = {
-    ".github/copilot-instructions.md",
-    ".cursorrules",
-    ".cursorignore",
-    ".aider",
-    ".aider.conf.yml",
-    ".codeiumrc",
-    ".tabnine",
-    ".continue/config.json",
-    "CLAUDE.md",
-    ".windsurfrules",
+# AI_COMMIT_PATTERNS fused into one scan. The outer lookahead keeps matches
+# zero-width so overlapping signals are all seen; the two co-author signals
+# share a start offset, so each gets its own optional lookahead there.
+AI_COMMIT_RE = re.compile(
+    r"(?=co-authored-by:"
+    r"(?=(?P<bot>[^\n]*\[bot\]))?"
+    r"(?=(?P<copilot_ca>[^\n]*copilot))?"
+    r"|(?P<copilot>copilot)"
+    r"|(?P<gpt>chatgpt|chat-gpt|gpt-4|gpt-3)"
+    r"|(?P<gemini>gemini|bard)"
+    r"|(?P<claude>claude|anthropic)"
+    r"|(?P<generated>ai[- ]generated)"
+    r"|(?P<assisted>ai[- ]assisted)"
+    r"|(?P<tools>cursor|codeium|tabnine|cody))",
+    re.IGNORECASE,
+)
+_AI_COMMIT_GROUPS = sorted(AI_COMMIT_RE.groupindex, key=AI_COMMIT_RE.groupindex.__getitem__)
+
+
+def ai_commit_signals(message: str) -> set[str]:
+    """Names of the AI_COMMIT_PATTERNS signals found in a commit message.
+
+    Same result as searching each pattern in turn, in one scan.
+    """
+    return {
+        name
+        for m in AI_COMMIT_RE.finditer(message)
+        for name, hit in zip(_AI_COMMIT_GROUPS, m.groups(), strict=True)
+        if hit is not None
+    }
+
+
+# AI-related keywords in repo names/descriptions.
+# Lowercase-only, matched against lowercased text: IGNORECASE makes _sre
+# case-fold every character and skips its literal-prefix fast paths.
+_AI_NAME_RE = re.compile(
+    r"ai|ml|gpt|llm|neural|model|predict|classify|detect|nlp|bert|transformer|diffusion|rag|agent"
+)
+
+# Mentions of AI tool config (copilot-instructions, .cursorrules, ...) in repo metadata;
+# also lowercase-only
+_AI_CONFIG_RE = re.compile(
+    r"copilot[- ]?instructions|cursorrules|\.aider|codeium|tabnine|continue|windsurf"
+)
+
+# Repo topics that signal AI/ML work
+_AI_TOPICS = frozenset(
+    {
+        "machine-learning",
+        "deep-learning",
+        "artificial-intelligence",
+        "ai",
+        "ml",
+        "nlp",
+        "llm",
+        "gpt",
+        "transformers",
+        "neural-network",
+        "computer-vision",
+        "data-science",
+        "chatgpt",
+        "copilot",
+        "generative-ai",
+        "rag",
+        "langchain",
+        "openai",
+        "huggingface",
+        "stable-diffusion",
+    }
+)
+
+# Topic substrings that identify a specific AI tool
+_AI_TOOL_KEYWORDS: dict[str, str] = {
+    "copilot": "GitHub Copilot",
+    "chatgpt": "ChatGPT/OpenAI",
+    "openai": "ChatGPT/OpenAI",
+    "gemini": "Google Gemini",
+    "bard": "Google Gemini",
+    "claude": "Claude",
+    "cursor": "Cursor",
+    "windsurf": "Windsurf",
+    "aider": "Aider",
 }
+# Zero-width lookahead so overlapping keywords ("openaider") all match,
+# mirroring the independent substring checks it replaces.
+_AI_TOOL_RE = re.compile("(?=(" + "|".join(_AI_TOOL_KEYWORDS) + "))")
+
+# AI config files that indicate AI tool usage
+AI_CONFIG_FILES = frozenset(
+    {
+        ".github/copilot-instructions.md",
+        ".cursorrules",
+        ".cursorignore",
+        ".aider",
+        ".aider.conf.yml",
+        ".codeiumrc",
+        ".tabnine",
+        ".continue/config.json",
+        "CLAUDE.md",
+        ".windsurfrules",
+    }
+)
 
 # Developer archetype definitions with weighted scoring
 ARCHETYPES = {
@@ -175,105 +287,138 @@ ARCHETYPES = {
 }
 
 # Language group indicators for archetype requirements
-BACKEND_LANGUAGES = {
-    "Python",
-    "Java",
-    "Go",
-    "Rust",
-    "C#",
-    "C++",
-    "Ruby",
-    "PHP",
-    "Kotlin",
-    "Scala",
-    "Elixir",
-}
-FRONTEND_LANGUAGES = {
-    "TypeScript",
-    "JavaScript",
-    "CSS",
-    "HTML",
-    "Svelte",
-    "Vue",
-    "Dart",
-}
-DATA_SCIENCE_LANGUAGES = {"Python", "Jupyter Notebook", "R", "Julia"}
-DEVOPS_TOPICS = {
-    "docker",
-    "kubernetes",
-    "terraform",
-    "ansible",
-    "ci-cd",
-    "devops",
-    "aws",
-    "gcp",
-    "azure",
-    "helm",
-    "jenkins",
-    "github-actions",
-}
-SECURITY_TOPICS = {
-    "security",
-    "vulnerability",
-    "pentest",
-    "ctf",
-    "exploit",
-    "cybersecurity",
-    "infosec",
-    "cryptography",
-    "owasp",
-}
+BACKEND_LANGUAGES = frozenset(
+    {
+        "Python",
+        "Java",
+        "Go",
+        "Rust",
+        "C#",
+        "C++",
+        "Ruby",
+        "PHP",
+        "Kotlin",
+        "Scala",
+        "Elixir",
+    }
+)
+FRONTEND_LANGUAGES = frozenset(
+    {
+        "TypeScript",
+        "JavaScript",
+        "CSS",
+        "HTML",
+        "Svelte",
+        "Vue",
+        "Dart",
+    }
+)
+DATA_SCIENCE_LANGUAGES = frozenset({"Python", "Jupyter Notebook", "R", "Julia"})
+DEVOPS_TOPICS = frozenset(
+    {
+        "docker",
+        "kubernetes",
+        "terraform",
+        "ansible",
+        "ci-cd",
+        "devops",
+        "aws",
+        "gcp",
+        "azure",
+        "helm",
+        "jenkins",
+        "github-actions",
+    }
+)
+SECURITY_TOPICS = frozenset(
+    {
+        "security",
+        "vulnerability",
+        "pentest",
+        "ctf",
+        "exploit",
+        "cybersecurity",
+        "infosec",
+        "cryptography",
+        "owasp",
+    }
+)
 
 # Framework detection from repo topics
-KNOWN_FRAMEWORKS = {
-    "react",
-    "nextjs",
-    "vue",
-    "angular",
-    "svelte",
-    "fastapi",
-    "django",
-    "flask",
-    "express",
-    "nestjs",
-    "pytorch",
-    "tensorflow",
-    "langchain",
-    "docker",
-    "kubernetes",
-    "tailwindcss",
-    "graphql",
-    "postgres",
-    "mongodb",
-    "spring",
-    "rails",
-    "laravel",
-    "gin",
-    "actix",
-    "rocket",
-    "deno",
-    "bun",
-    "remix",
-    "nuxt",
-    "astro",
-    "solidjs",
-    "htmx",
-    "prisma",
-    "drizzle",
-    "supabase",
-    "firebase",
-    "vercel",
-    "aws",
-    "gcp",
-    "azure",
-}
-
-
+KNOWN_FRAMEWORKS = frozenset(
+    {
+        "react",
+        "nextjs",
+        "vue",
+        "angular",
+        "svelte",
+        "fastapi",
+        "django",
+        "flask",
+        "express",
+        "nestjs",
+        "pytorch",
+        "tensorflow",
+        "langchain",
+        "docker",
+        "kubernetes",
+        "tailwindcss",
+        "graphql",
+        "postgres",
+        "mongodb",
+        "spring",
+        "rails",
+        "laravel",
+        "gin",
+        "actix",
+        "rocket",
+        "deno",
+        "bun",
+        "remix",
+        "nuxt",
+        "astro",
+        "solidjs",
+        "htmx",
+        "prisma",
+        "drizzle",
+        "supabase",
+        "firebase",
+        "vercel",
+        "aws",
+        "gcp",
+        "azure",
+    }
+)
+
+# Ecosystem detection groups
+_WEB_FRAMEWORKS = frozenset(
+    {"react", "nextjs", "vue", "angular", "svelte", "remix", "nuxt", "astro"}
+)
+_BACKEND_FRAMEWORKS = frozenset(
+    {"fastapi", "django", "flask", "express", "nestjs", "spring", "rails", "laravel", "gin"}
+)
+_ML_FRAMEWORKS = frozenset({"pytorch", "tensorflow", "langchain"})
+_DEVOPS_TOOLS = frozenset({"docker", "kubernetes", "terraform", "ansible"})
+_DATA_SCIENCE_ONLY_LANGUAGES = frozenset({"Jupyter Notebook", "R", "Julia"})
+_ECOSYSTEM_BACKEND_LANGUAGES = frozenset({"Python", "Java", "Go", "Rust", "C++"})
+_ECOSYSTEM_FRONTEND_LANGUAGES = frozenset({"TypeScript", "JavaScript"})
+
+_SECONDS_PER_DAY = 86_400
+
+# Re-scoring the same profile (retries, dashboard refreshes) reuses results briefly;
+# the TTL bounds how stale the time-decayed activity score can get.
+_RESULT_TTL_SECONDS = 300
+_RESULT_CACHE_SIZE = 1024
+_result_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=4096)
 def _log_scale(value: float, max_val: float, points: float) -> float:
     """Logarithmic scaling for diminishing returns.
 
     Maps [0, inf) to [0, points] with fast initial growth
     and diminishing returns past the reference max_val.
+    Cached: inputs are small integer counts against fixed references.
     """
     if value <= 0:
         return 0.0
@@ -281,26 +426,175 @@ def _log_scale(value: float, max_val: float, points: float) -> float:
     return min(scaled, points)
 
 
-def _time_decay_weight(date_str: str | None, half_life_days: int = 180) -> float:
+def _time_decay_weight(
+    date_str: str | None, half_life_days: int = 180, now_ts: float | None = None
+) -> float:
     """Calculate time-decay weight (0.0 to 1.0).
 
     Recent dates get weight closer to 1.0, older dates decay exponentially.
     Half-life determines how fast the decay is (default 6 months).
+    Pass ``now_ts`` (epoch seconds) to score many dates against one reference time.
     """
     if not date_str:
         return 0.0
     try:
-        dt_str = date_str[:19].replace("T", " ")
-        if len(dt_str) == 10:
-            dt = datetime.strptime(dt_str, "%Y-%m-%d").replace(tzinfo=UTC)
-        else:
-            dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=UTC)
-        days_ago = (datetime.now(UTC) - dt).days
+        dt = datetime.fromisoformat(date_str[:19]).replace(tzinfo=UTC)
+        if now_ts is None:
+            now_ts = time.time()
+        days_ago = (now_ts - dt.timestamp()) // _SECONDS_PER_DAY
         return math.exp(-0.693 * days_ago / half_life_days)  # 0.693 = ln(2)
     except (ValueError, TypeError):
         return 0.0
 
 
+def _freshness_sum(
+    updated_ats: Iterable[str | None], half_life_days: int = 180, now_ts: float | None = None
+) -> float:
+    """Sum time-decay weights for a batch of dates against a single reference time."""
+    if now_ts is None:
+        now_ts = time.time()
+    return sum(_time_decay_weight(d, half_life_days, now_ts) for d in updated_ats)
+
+
+def _result_key(profile: dict[str, Any], commit_data: list[dict[str, Any]] | None) -> str:
+    """Content hash of the scoring inputs."""
+    payload = json.dumps([profile, commit_data], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _count_matching(pattern: re.Pattern[str], texts: list[str]) -> int:
+    """Count texts containing a match, scanning their newline-joined blob.
+
+    After each hit the scan resumes at the next text, so the regex engine
+    runs once per matching text plus once, not once per text. Patterns
+    must not match across a newline.
+    """
+    blob = "\n".join(texts)
+    ends = list(accumulate(len(t) + 1 for t in texts))  # end offset past each separator
+    count = pos = 0
+    search = pattern.search
+    while match := search(blob, pos):
+        count += 1
+        pos = ends[bisect_right(ends, match.start())]
+    return count
+
+
+class _ProfileAggregates(NamedTuple):
+    """Per-profile values shared by several scoring passes."""
+
+    all_topics: frozenset[str]
+    lang_names: frozenset[str]
+    total_stars: int
+    total_forks: int
+    ai_repo_count: int
+    ai_config_count: int
+    updated_ats: tuple[str | None, ...]
+    topic_text: str  # lowercased topics, newline-separated, in repo order
+    top_repos: tuple[dict[str, Any], ...]  # five most-starred, ties in repo order
+
+
+def _profile_aggregates(profile: dict[str, Any]) -> _ProfileAggregates:
+    """Walk the profile once and collect the values every scorer needs."""
+    repos = profile.get("repos", [])
+    languages = profile.get("languages", [])
+    if isinstance(languages, dict):
+        lang_names = frozenset(languages)
+    else:
+        lang_names = frozenset(lang.get("name", "") for lang in languages)
+
+    total_forks = 0
+    stars: list[int] = []
+    topics_seen: list[str] = []
+    updated_ats: list[str | None] = []
+    name_texts: list[str] = []
+    config_texts: list[str] = []
+    for r in repos:
+        name = r.get("name", "")
+        desc = r.get("description", "") or ""
+        topics = r.get("topics", [])
+        stars.append(r.get("stars", 0))
+        total_forks += r.get("forks", 0)
+        name_texts.append(f"{name}\t{desc}".lower())
+        # No file-tree access: AI config files are inferred from repo metadata
+        config_texts.append(f"{name} {desc} {' '.join(topics)}".lower())
+        topics_seen.extend(t.lower() for t in topics)
+        updated_ats.append(r.get("updated_at"))
+
+    return _ProfileAggregates(
+        all_topics=frozenset(map(sys.intern, topics_seen)),
+        lang_names=lang_names,
+        total_stars=sum(stars),
+        total_forks=total_forks,
+        ai_repo_count=_count_matching(_AI_NAME_RE, name_texts),
+        ai_config_count=_count_matching(_AI_CONFIG_RE, config_texts),
+        updated_ats=tuple(updated_ats),
+        topic_text="\n".join(topics_seen),
+        top_repos=tuple(repos[i] for i in heapq.nlargest(5, range(len(stars)), stars.__getitem__)),
+    )
+
+
+# Archetype "requires" flags as bits, so each profile checks its groups once
+_REQUIREMENT_BITS = {
+    "backend_langs": 1 << 0,
+    "frontend_langs": 1 << 1,
+    "data_science_langs": 1 << 2,
+    "devops_topics": 1 << 3,
+    "security_topics": 1 << 4,
+}
+
+
+class _ArchetypeSpec(NamedTuple):
+    """One ARCHETYPES entry flattened for classification.
+
+    Weights are split by sign so scoring needs no filtering per call.
+    """
+
+    id: str
+    name: str
+    description: str
+    min_score: float
+    positive: tuple[tuple[str, float], ...]
+    negative: tuple[tuple[str, float], ...]
+    positive_sum: float
+    req_mask: int
+
+
+def _archetype_spec(archetype_id: str, archetype: dict[str, Any]) -> _ArchetypeSpec:
+    weights = archetype["weights"]
+    positive = tuple((dim, w) for dim, w in weights.items() if w > 0)
+    return _ArchetypeSpec(
+        id=archetype_id,
+        name=archetype["name"],
+        description=archetype["description"],
+        min_score=archetype["min_score"],
+        positive=positive,
+        negative=tuple((dim, w) for dim, w in weights.items() if w < 0),
+        positive_sum=sum(w for _, w in positive),
+        req_mask=sum(
+            _REQUIREMENT_BITS[req] for req, on in archetype.get("requires", {}).items() if on
+        ),
+    )
+
+
+_ARCHETYPE_TABLE = tuple(_archetype_spec(aid, a) for aid, a in ARCHETYPES.items())
+
+
+def _requirement_bits(lang_names: frozenset[str], all_topics: frozenset[str]) -> int:
+    """Bitmask of the archetype requirement groups a profile satisfies."""
+    bits = 0
+    if not lang_names.isdisjoint(BACKEND_LANGUAGES):
+        bits |= _REQUIREMENT_BITS["backend_langs"]
+    if not lang_names.isdisjoint(FRONTEND_LANGUAGES):
+        bits |= _REQUIREMENT_BITS["frontend_langs"]
+    if not lang_names.isdisjoint(DATA_SCIENCE_LANGUAGES):
+        bits |= _REQUIREMENT_BITS["data_science_langs"]
+    if not all_topics.isdisjoint(DEVOPS_TOPICS):
+        bits |= _REQUIREMENT_BITS["devops_topics"]
+    if not all_topics.isdisjoint(SECURITY_TOPICS):
+        bits |= _REQUIREMENT_BITS["security_topics"]
+    return bits
+
+
 class ScoringEngine:
     """Profile scoring and archetype classification engine V2."""
 
@@ -322,15 +616,44 @@ class ScoringEngine:
         Returns:
             Scoring result with scores, archetype, and AI analysis
         """
+        key = _result_key(profile, commit_data)
+        now = time.monotonic()
+        cached = _result_cache.get(key)
+        if cached is not None and cached[0] > now:
+            ARCHETYPES_ASSIGNED.labels(archetype=cached[1]["archetype"]["id"]).inc()
+            return copy.deepcopy(cached[1])
+
+        result = self._score_uncached(profile, commit_data)
+
+        _result_cache.pop(key, None)
+        if len(_result_cache) >= _RESULT_CACHE_SIZE:
+            # Entries are inserted in expiry order; drop the oldest
+            _result_cache.pop(next(iter(_result_cache)), None)
+        _result_cache[key] = (now + _RESULT_TTL_SECONDS, copy.deepcopy(result))
+        return result
+
+    def _score_uncached(
+        self,
+        profile: dict[str, Any],
+        commit_data: list[dict[str, Any]] | None,
+    ) -> dict[str, Any]:
+        """Run every scorer; score_profile wraps this with the result cache."""
         # Analyze commits if available
         commit_analysis: CommitAnalysisResult | None = None
+        commit_signals: Counter[str] | None = None
         if commit_data:
             commit_analysis = self.commit_analyzer.analyze_commits(commit_data)
+            commit_signals = Counter(
+                signal
+                for commit in commit_data
+                for signal in ai_commit_signals(commit.get("message", ""))
+            )
 
-        activity = self._score_activity(profile)
-        collaboration = self._score_collaboration(profile)
-        stack_diversity = self._score_stack_diversity(profile)
-        ai_savviness = self._score_ai_savviness(profile, commit_analysis)
+        agg = _profile_aggregates(profile)
+        activity = self._score_activity(profile, agg, time.time())
+        collaboration = self._score_collaboration(profile, agg)
+        stack_diversity = self._score_stack_diversity(profile, agg)
+        ai_savviness = self._score_ai_savviness(profile, commit_analysis, agg)
 
         scores = {
             "activity": activity,
@@ -339,8 +662,10 @@ class ScoringEngine:
             "ai_savviness": ai_savviness,
         }
 
-        archetype = self._classify_archetype(scores, profile)
-        ai_analysis = self._analyze_ai_usage(profile, commit_analysis)
+        archetype = self._classify_archetype(scores, profile, agg)
+        ai_analysis = self._analyze_ai_usage(
+            profile, commit_analysis, agg, ai_savviness, commit_signals
+        )
 
         ARCHETYPES_ASSIGNED.labels(archetype=archetype["id"]).inc()
 
@@ -348,10 +673,15 @@ class ScoringEngine:
             "scores": scores,
             "archetype": archetype,
             "ai_analysis": ai_analysis,
-            "tech_profile": self._build_tech_profile(profile),
+            "tech_profile": self._build_tech_profile(profile, agg),
         }
 
-    def _score_activity(self, profile: dict[str, Any]) -> int:
+    def _score_activity(
+        self,
+        profile: dict[str, Any],
+        agg: _ProfileAggregates | None = None,
+        now_ts: float | None = None,
+    ) -> int:
         """Score developer activity (0-100).
 
         V2: Logarithmic scaling, time-decay weighting, consistency bonus.
@@ -359,6 +689,7 @@ class ScoringEngine:
         score = 0.0
         repos = profile.get("repos", [])
         stats = profile.get("contribution_stats", {})
+        agg = agg or _profile_aggregates(profile)
 
         # Repo count - log scale (max 25 points)
         repo_count = len(repos)
@@ -370,15 +701,12 @@ class ScoringEngine:
 
         # Repo freshness with time-decay (max 25 points)
         if repos:
-            freshness_sum = sum(
-                _time_decay_weight(r.get("updated_at"), half_life_days=180) for r in repos
-            )
+            freshness_sum = _freshness_sum(agg.updated_ats, now_ts=now_ts)
             freshness_score = min(freshness_sum / 5.0, 1.0)
             score += freshness_score * 25
 
         # Stars received - log scale (max 15 points)
-        total_stars = sum(r.get("stars", 0) for r in repos)
-        score += _log_scale(total_stars, 200, 15)
+        score += _log_scale(agg.total_stars, 200, 15)
 
         # Consistency bonus: event type diversity (max 10 points)
         event_types = 0
@@ -394,14 +722,16 @@ class ScoringEngine:
 
         return min(int(score), 100)
 
-    def _score_collaboration(self, profile: dict[str, Any]) -> int:
+    def _score_collaboration(
+        self, profile: dict[str, Any], agg: _ProfileAggregates | None = None
+    ) -> int:
         """Score collaboration level (0-100).
 
         V2: Log scaling, follower ratio, org membership bonus.
         """
         score = 0.0
         stats = profile.get("contribution_stats", {})
-        repos = profile.get("repos", [])
+        agg = agg or _profile_aggregates(profile)
 
         # Recent PRs - log scale (max 20 points)
         score += _log_scale(stats.get("recent_prs", 0), 15, 20)
@@ -422,8 +752,7 @@ class ScoringEngine:
         score += min(ratio * 3, 10)
 
         # Forks received (max 15 points)
-        total_forks = sum(r.get("forks", 0) for r in repos)
-        score += _log_scale(total_forks, 50, 15)
+        score += _log_scale(agg.total_forks, 50, 15)
 
         # Org membership bonus (max 5 points)
         orgs = profile.get("organizations", [])
@@ -431,14 +760,16 @@ class ScoringEngine:
 
         return min(int(score), 100)
 
-    def _score_stack_diversity(self, profile: dict[str, Any]) -> int:
+    def _score_stack_diversity(
+        self, profile: dict[str, Any], agg: _ProfileAggregates | None = None
+    ) -> int:
         """Score stack/language diversity (0-100).
 
         V2: Shannon entropy for distribution, framework detection, ecosystem breadth.
         """
         score = 0.0
         languages = profile.get("languages", [])
-        repos = profile.get("repos", [])
+        agg = agg or _profile_aggregates(profile)
 
         # Number of languages - log scale (max 30 points)
         lang_count = len(languages)
@@ -452,18 +783,13 @@ class ScoringEngine:
             else:
                 fractions = [lang.get("percentage", 0) / 100 for lang in languages]
 
-            entropy = 0.0
-            for frac in fractions:
-                if frac > 0:
-                    entropy -= frac * math.log2(frac)
+            entropy = -sum(frac * math.log2(frac) for frac in fractions if frac > 0)
             max_entropy = math.log2(max(lang_count, 2))
             evenness = entropy / max_entropy if max_entropy > 0 else 0
             score += evenness * 25
 
         # Framework detection from topics (max 25 points)
-        all_topics: set[str] = set()
-        for repo in repos:
-            all_topics.update(t.lower() for t in repo.get("topics", []))
+        all_topics = agg.all_topics
         detected_frameworks = all_topics & KNOWN_FRAMEWORKS
         score += _log_scale(len(detected_frameworks), 8, 25)
 
@@ -477,70 +803,30 @@ class ScoringEngine:
         self,
         profile: dict[str, Any],
         commit_analysis: CommitAnalysisResult | None = None,
+        agg: _ProfileAggregates | None = None,
     ) -> int:
         """Score AI-savviness (0-100).
 
         V2: AI config detection, commit burst patterns, weighted factors.
         """
         score = 0.0
-        repos = profile.get("repos", [])
+        n_repos = len(profile.get("repos", []))
+        agg = agg or _profile_aggregates(profile)
 
         # AI-related topics (max 18 points)
-        ai_topics = {
-            "machine-learning",
-            "deep-learning",
-            "artificial-intelligence",
-            "ai",
-            "ml",
-            "nlp",
-            "llm",
-            "gpt",
-            "transformers",
-            "neural-network",
-            "computer-vision",
-            "data-science",
-            "chatgpt",
-            "copilot",
-            "generative-ai",
-            "rag",
-            "langchain",
-            "openai",
-            "huggingface",
-            "stable-diffusion",
-        }
-        all_topics: set[str] = set()
-        for repo in repos:
-            all_topics.update(t.lower() for t in repo.get("topics", []))
-
-        ai_topic_count = len(all_topics & ai_topics)
+        ai_topic_count = len(_AI_TOPICS & agg.all_topics)
         score += _log_scale(ai_topic_count, 6, 18)
 
         # AI framework languages (max 12 points)
-        ai_languages = {"Python", "Jupyter Notebook", "R", "Julia"}
-        languages = profile.get("languages", [])
-        if isinstance(languages, dict):
-            lang_names = set(languages.keys())
-        else:
-            lang_names = {lang["name"] for lang in languages}
-        ai_lang_count = len(lang_names & ai_languages)
+        ai_lang_count = len(agg.lang_names & DATA_SCIENCE_LANGUAGES)
         score += min(ai_lang_count / 2 * 12, 12)
 
         # AI repo names/descriptions (max 12 points)
-        ai_name_patterns = re.compile(
-            r"ai|ml|gpt|llm|neural|model|predict|classify"
-            r"|detect|nlp|bert|transformer|diffusion|rag|agent",
-            re.IGNORECASE,
-        )
-        ai_repos = sum(
-            1
-            for r in repos
-            if ai_name_patterns.search(r.get("name", ""))
-            or ai_name_patterns.search(r.get("description", "") or "")
-        )
+        ai_repos = agg.ai_repo_count
         score += _log_scale(ai_repos, 5, 12)
 
         # AI config file detection bonus (max 8 points)
-        ai_config_score = self._detect_ai_config_files(repos)
+        ai_config_score = agg.ai_config_count
         score += min(ai_config_score * 4, 8)
 
         # Commit analysis signals (max 35 points)
@@ -562,90 +848,46 @@ class ScoringEngine:
             if commit_analysis.burst_score > 0:
                 score += min(commit_analysis.burst_score * 2, 2)
 
-        # Bonus for high AI repo ratio (max 15 points)
-        if len(repos) > 0:
-            ai_repo_ratio = ai_repos / len(repos)
-            score += ai_repo_ratio * 15
+        # Bonus for high AI repo ratio (max 15 points); ai_repos <= n_repos
+        if ai_repos:
+            score += ai_repos / n_repos * 15
 
         return min(int(score), 100)
 
-    def _detect_ai_config_files(self, repos: list[dict[str, Any]]) -> int:
-        """Detect AI config file indicators from repo metadata.
-
-        Since we do not access file trees, uses heuristic detection
-        based on repo topics and descriptions mentioning AI tool config.
-        """
-        ai_config_indicators = 0
-        config_patterns = re.compile(
-            r"copilot[- ]?instructions|cursorrules|\.aider"
-            r"|codeium|tabnine|continue|windsurf",
-            re.IGNORECASE,
-        )
-        for repo in repos:
-            desc = repo.get("description", "") or ""
-            name = repo.get("name", "")
-            topics = " ".join(repo.get("topics", []))
-            combined = f"{name} {desc} {topics}"
-            if config_patterns.search(combined):
-                ai_config_indicators += 1
-        return ai_config_indicators
-
     def _classify_archetype(
-        self, scores: dict[str, int], profile: dict[str, Any]
+        self,
+        scores: dict[str, int],
+        profile: dict[str, Any],
+        agg: _ProfileAggregates | None = None,
     ) -> dict[str, Any]:
         """Classify developer archetype based on weighted scoring.
 
         V2: Weighted scoring with requirement checks and ranked alternatives.
         """
-        repos = profile.get("repos", [])
-        languages = profile.get("languages", [])
-
-        # Extract language names
-        if isinstance(languages, dict):
-            lang_names = set(languages.keys())
-        else:
-            lang_names = {lang.get("name", "") for lang in languages}
-
-        # Collect all topics
-        all_topics: set[str] = set()
-        for repo in repos:
-            all_topics.update(t.lower() for t in repo.get("topics", []))
+        agg = agg or _profile_aggregates(profile)
+        satisfied = _requirement_bits(agg.lang_names, agg.all_topics)
 
         # Compute weighted score for each archetype
-        archetype_scores: list[tuple[str, float, dict]] = []
+        archetype_scores: list[tuple[str, float, _ArchetypeSpec]] = []
 
-        for archetype_id, archetype in ARCHETYPES.items():
+        for spec in _ARCHETYPE_TABLE:
             # Check requirements
-            reqs = archetype.get("requires", {})
-            if reqs.get("backend_langs") and not (lang_names & BACKEND_LANGUAGES):
-                continue
-            if reqs.get("frontend_langs") and not (lang_names & FRONTEND_LANGUAGES):
-                continue
-            if reqs.get("data_science_langs") and not (lang_names & DATA_SCIENCE_LANGUAGES):
-                continue
-            if reqs.get("devops_topics") and not (all_topics & DEVOPS_TOPICS):
-                continue
-            if reqs.get("security_topics") and not (all_topics & SECURITY_TOPICS):
+            if satisfied & spec.req_mask != spec.req_mask:
                 continue
 
             # Calculate weighted score (normalized by positive weight sum)
-            weights = archetype["weights"]
-            positive_sum = sum(w for w in weights.values() if w > 0)
-            weighted = sum(
-                scores.get(dim, 0) * weight for dim, weight in weights.items() if weight > 0
-            )
+            weighted = sum(scores.get(dim, 0) * w for dim, w in spec.positive)
             # Normalize so all archetypes produce comparable 0-100 range
-            weighted = weighted / positive_sum if positive_sum > 0 else 0
+            weighted = weighted / spec.positive_sum if spec.positive_sum > 0 else 0
             # Apply negative weights as penalties (unnormalized)
-            for dim, weight in weights.items():
-                if weight < 0:
-                    weighted += scores.get(dim, 0) * weight
+            for dim, w in spec.negative:
+                weighted += scores.get(dim, 0) * w
 
-            if weighted >= archetype["min_score"]:
-                archetype_scores.append((archetype_id, weighted, archetype))
+            if weighted >= spec.min_score:
+                archetype_scores.append((spec.id, weighted, spec))
 
-        # Sort by weighted score (highest first)
-        archetype_scores.sort(key=lambda x: x[1], reverse=True)
+        # Primary plus up to three alternatives, by weighted score (highest first)
+        archetype_scores = heapq.nlargest(4, archetype_scores, key=itemgetter(1))
 
         if not archetype_scores:
             fallback = ARCHETYPES["code_explorer"]
@@ -667,14 +909,13 @@ class ScoringEngine:
             confidence = 0.9
 
         alternatives = [
-            {"id": aid, "name": a["name"], "score": round(s, 1)}
-            for aid, s, a in archetype_scores[1:4]
+            {"id": aid, "name": a.name, "score": round(s, 1)} for aid, s, a in archetype_scores[1:4]
         ]
 
         return {
             "id": primary_id,
-            "name": primary["name"],
-            "description": primary["description"],
+            "name": primary.name,
+            "description": primary.description,
             "confidence": round(confidence, 2),
             "alternatives": alternatives,
         }
@@ -683,15 +924,20 @@ class ScoringEngine:
         self,
         profile: dict[str, Any],
         commit_analysis: CommitAnalysisResult | None = None,
+        agg: _ProfileAggregates | None = None,
+        ai_score: int | None = None,
+        commit_signals: Counter[str] | None = None,
     ) -> dict[str, Any]:
         """Analyze AI tool usage based on available data.
 
         V2: AI config detection, burst analysis, confidence scoring.
+        ``commit_signals`` counts commits per ai_commit_signals name.
         """
-        repos = profile.get("repos", [])
+        agg = agg or _profile_aggregates(profile)
 
         # Determine AI score bucket
-        ai_score = self._score_ai_savviness(profile, commit_analysis)
+        if ai_score is None:
+            ai_score = self._score_ai_savviness(profile, commit_analysis, agg)
         if ai_score >= 60:
             bucket = "60_100"
         elif ai_score >= 30:
@@ -702,25 +948,7 @@ class ScoringEngine:
             bucket = "0_10"
 
         # Detect AI tools from repo topics and names
-        detected_tools: set[str] = set()
-        for repo in repos:
-            topics = repo.get("topics", [])
-            for topic in topics:
-                topic_lower = topic.lower()
-                if "copilot" in topic_lower:
-                    detected_tools.add("GitHub Copilot")
-                if "chatgpt" in topic_lower or "openai" in topic_lower:
-                    detected_tools.add("ChatGPT/OpenAI")
-                if "gemini" in topic_lower or "bard" in topic_lower:
-                    detected_tools.add("Google Gemini")
-                if "claude" in topic_lower:
-                    detected_tools.add("Claude")
-                if "cursor" in topic_lower:
-                    detected_tools.add("Cursor")
-                if "windsurf" in topic_lower:
-                    detected_tools.add("Windsurf")
-                if "aider" in topic_lower:
-                    detected_tools.add("Aider")
+        detected_tools = {_AI_TOOL_KEYWORDS[m] for m in _AI_TOOL_RE.findall(agg.topic_text)}
 
         # Merge tools from commit analysis
         confidence = "estimated"
@@ -744,6 +972,7 @@ class ScoringEngine:
                 "co_author_bots": commit_analysis.co_author_bots,
                 "co_authors": commit_analysis.co_authors[:10],
                 "burst_score": commit_analysis.burst_score,
+                "ai_commit_signals": dict(sorted((commit_signals or {}).items())),
             }
 
         result: dict[str, Any] = {
@@ -762,20 +991,15 @@ class ScoringEngine:
 
         return result
 
-    def _build_tech_profile(self, profile: dict[str, Any]) -> dict[str, Any]:
+    def _build_tech_profile(
+        self, profile: dict[str, Any], agg: _ProfileAggregates | None = None
+    ) -> dict[str, Any]:
         """Build a summarized tech profile for prompt orchestration."""
-        repos = profile.get("repos", [])
         languages = profile.get("languages", [])
+        agg = agg or _profile_aggregates(profile)
 
         # Detect frameworks from repo topics
-        framework_topics: set[str] = set()
-        for repo in repos:
-            framework_topics.update(t.lower() for t in repo.get("topics", []))
-
-        detected_frameworks = sorted(framework_topics & KNOWN_FRAMEWORKS)
-
-        # Top repos by stars
-        top_repos = sorted(repos, key=lambda r: r.get("stars", 0), reverse=True)[:5]
+        detected_frameworks = sorted(agg.all_topics & KNOWN_FRAMEWORKS)
 
         # Compute primary ecosystem
         if isinstance(languages, dict):
@@ -795,7 +1019,7 @@ class ScoringEngine:
                     "stars": r.get("stars", 0),
                     "description": (r.get("description") or "")[:100],
                 }
-                for r in top_repos
+                for r in agg.top_repos
             ],
             "primary_ecosystem": primary_ecosystem,
         }
@@ -803,42 +1027,23 @@ class ScoringEngine:
     @staticmethod
     def _detect_ecosystem(languages: set[str], frameworks: set[str]) -> str:
         """Detect primary development ecosystem."""
-        web_fws = {
-            "react",
-            "nextjs",
-            "vue",
-            "angular",
-            "svelte",
-            "remix",
-            "nuxt",
-            "astro",
-        }
-        backend_fws = {
-            "fastapi",
-            "django",
-            "flask",
-            "express",
-            "nestjs",
-            "spring",
-            "rails",
-            "laravel",
-            "gin",
-        }
-        ml_fws = {"pytorch", "tensorflow", "langchain"}
-        devops_tools = {"docker", "kubernetes", "terraform", "ansible"}
+        has_web = not frameworks.isdisjoint(_WEB_FRAMEWORKS)
+        has_backend = not frameworks.isdisjoint(_BACKEND_FRAMEWORKS)
 
-        if frameworks & ml_fws or languages & {"Jupyter Notebook", "R", "Julia"}:
+        if not frameworks.isdisjoint(_ML_FRAMEWORKS) or not languages.isdisjoint(
+            _DATA_SCIENCE_ONLY_LANGUAGES
+        ):
             return "data-science"
-        if frameworks & web_fws and frameworks & backend_fws:
+        if has_web and has_backend:
             return "full-stack"
-        if frameworks & web_fws:
+        if has_web:
             return "frontend"
-        if frameworks & backend_fws:
+        if has_backend:
             return "backend"
-        if frameworks & devops_tools:
+        if not frameworks.isdisjoint(_DEVOPS_TOOLS):
             return "devops"
-        if languages & {"Python", "Java", "Go", "Rust", "C++"}:
+        if not languages.isdisjoint(_ECOSYSTEM_BACKEND_LANGUAGES):
             return "backend"
-        if languages & {"TypeScript", "JavaScript"}:
+        if not languages.isdisjoint(_ECOSYSTEM_FRONTEND_LANGUAGES):
             return "frontend"
         return "general"
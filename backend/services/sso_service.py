@@ -15,6 +15,7 @@ import json
 import secrets
 import time
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
@@ -74,10 +75,14 @@ class SSOSession(BaseModel):
 
 
 _REDIS_PREFIX = "sso:"
+_ORG_SESSIONS_PREFIX = f"{_REDIS_PREFIX}org_sessions:"  # zset: session_id -> expiry
 _CONFIG_PREFIX = "sso_config:"
 _SESSION_TTL = 28800  # 8 hours
 _CONFIG_TTL = 86400  # 24 hours
 _NONCE_TTL = 300  # 5 minutes
+# Set once sessions created before the org index existed have been indexed
+_ORG_SESSIONS_BACKFILLED_KEY = f"{_REDIS_PREFIX}org_sessions_backfilled"
+_BACKFILL_BATCH = 500
 
 
 class SSOService:
@@ -86,14 +91,18 @@ class SSOService:
     def __init__(self, redis_client: Any) -> None:
         self._redis = redis_client
         self._settings = get_settings()
+        self._url_builders: dict[SSOProvider, Callable[[SSOConfig, str, str], str]] = {
+            SSOProvider.SAML: self._build_saml_request,
+            SSOProvider.OIDC: self._build_oidc_request,
+            SSOProvider.GITHUB: self._build_github_oauth_url,
+        }
 
     # --- Configuration Management ---
 
     async def save_sso_config(self, config: SSOConfig) -> dict[str, str]:
         """Save SSO configuration for an organization."""
         key = f"{_CONFIG_PREFIX}{config.org_id}"
-        data = config.model_dump(mode="json")
-        await self._redis.setex(key, _CONFIG_TTL, json.dumps(data))
+        await self._redis.setex(key, _CONFIG_TTL, config.model_dump_json())
         logger.info("SSO config saved", org_id=config.org_id)
         return {"status": "configured", "org_id": config.org_id}
 
@@ -103,7 +112,7 @@ class SSOService:
         raw = await self._redis.get(key)
         if raw is None:
             return None
-        return SSOConfig.model_validate(json.loads(raw))
+        return SSOConfig.model_validate_json(raw)
 
     async def delete_sso_config(self, org_id: str) -> bool:
         """Delete SSO configuration."""
@@ -125,23 +134,14 @@ class SSOService:
         nonce = secrets.token_urlsafe(32)
         state = secrets.token_urlsafe(32)
 
-        # Store nonce for verification
-        nonce_key = f"{_REDIS_PREFIX}nonce:{state}"
-        nonce_data = json.dumps(
-            {
-                "org_id": org_id,
-                "nonce": nonce,
-                "created_at": time.time(),
-            }
+        # Store state -> org_id and nonce for verification; the key TTL bounds its age
+        await self._redis.setex(
+            f"{_REDIS_PREFIX}nonce:{state}",
+            _NONCE_TTL,
+            json.dumps({"org_id": org_id, "nonce": nonce}),
         )
-        await self._redis.setex(nonce_key, _NONCE_TTL, nonce_data)
 
-        if config.provider == SSOProvider.SAML:
-            redirect_url = self._build_saml_request(config, nonce, state)
-        elif config.provider == SSOProvider.OIDC:
-            redirect_url = self._build_oidc_request(config, nonce, state)
-        else:
-            redirect_url = self._build_github_oauth_url(config, state)
+        redirect_url = self._url_builders[config.provider](config, nonce, state)
 
         return {
             "redirect_url": redirect_url,
@@ -156,31 +156,31 @@ class SSOService:
     ) -> SSOSession:
         """Verify SSO callback and create authenticated session.
 
-        Validates the state nonce, assertion signature, and creates
-        a session in Redis.
+        Validates the state nonce, the ID token's ``nonce`` claim (always
+        required for OIDC), the assertion signature, and creates a session
+        in Redis.
         """
-        # Verify state nonce
+        # Verify state nonce; GETDEL consumes it atomically (one-time use)
         nonce_key = f"{_REDIS_PREFIX}nonce:{state}"
-        nonce_raw = await self._redis.get(nonce_key)
+        nonce_raw = await self._redis.getdel(nonce_key)
         if nonce_raw is None:
             raise SSOError("Invalid or expired SSO state")
 
         nonce_data = json.loads(nonce_raw)
         org_id = nonce_data["org_id"]
 
-        # Delete nonce (one-time use)
-        await self._redis.delete(nonce_key)
-
-        # Check nonce age
-        created = nonce_data.get("created_at", 0)
-        if time.time() - created > _NONCE_TTL:
-            raise SSOError("SSO request expired")
-
         # Get SSO config
         config = await self.get_sso_config(org_id)
         if config is None:
             raise SSOError("SSO configuration not found")
 
+        # Replay protection: the token must echo the nonce we issued
+        claimed_nonce = assertion_data.get("nonce")
+        if (config.provider == SSOProvider.OIDC or claimed_nonce is not None) and (
+            not secrets.compare_digest(str(claimed_nonce or ""), nonce_data["nonce"])
+        ):
+            raise SSOError("Invalid SSO nonce")
+
         # Validate assertion (provider-specific)
         user_identity = self._extract_identity(config.provider, assertion_data)
 
@@ -191,7 +191,9 @@ class SSOService:
                 raise SSOError("Email domain not authorized")
 
         # Create session — hash user identity for privacy
-        user_hash = hashlib.sha256(user_identity.get("subject", "").encode()).hexdigest()
+        user_hash = hashlib.blake2b(
+            user_identity.get("subject", "").encode(), digest_size=16
+        ).hexdigest()
 
         session = SSOSession(
             org_id=org_id,
@@ -200,10 +202,16 @@ class SSOService:
             role=config.default_role,
         )
 
-        # Store session in Redis
+        # Store session in Redis, indexed per org for bulk revocation
         session_key = f"{_REDIS_PREFIX}session:{session.session_id}"
-        session_data = session.model_dump(mode="json")
-        await self._redis.setex(session_key, _SESSION_TTL, json.dumps(session_data))
+        index_key = f"{_ORG_SESSIONS_PREFIX}{org_id}"
+        now = time.time()
+        pipe = self._redis.pipeline()
+        pipe.setex(session_key, _SESSION_TTL, session.model_dump_json())
+        pipe.zremrangebyscore(index_key, 0, now)  # drop sessions that already expired
+        pipe.zadd(index_key, {session.session_id: now + _SESSION_TTL})
+        pipe.expire(index_key, _SESSION_TTL)
+        await pipe.execute()
 
         logger.info(
             "SSO session created",
@@ -219,27 +227,89 @@ class SSOService:
         raw = await self._redis.get(session_key)
         if raw is None:
             return None
-        return SSOSession.model_validate(json.loads(raw))
+        return SSOSession.model_validate_json(raw)
 
     async def revoke_session(self, session_id: str) -> bool:
         """Revoke an SSO session."""
         session_key = f"{_REDIS_PREFIX}session:{session_id}"
-        result = await self._redis.delete(session_key)
-        return result > 0
+        raw = await self._redis.get(session_key)
+        if raw is None:
+            return False
+        org_id = json.loads(raw).get("org_id", "")
+        pipe = self._redis.pipeline()
+        pipe.delete(session_key)
+        pipe.zrem(f"{_ORG_SESSIONS_PREFIX}{org_id}", session_id)
+        deleted, _ = await pipe.execute()
+        return deleted > 0
 
     async def revoke_all_sessions(self, org_id: str) -> int:
-        """Revoke all SSO sessions for an organization."""
-        pattern = f"{_REDIS_PREFIX}session:*"
-        revoked = 0
-        async for key in self._redis.scan_iter(match=pattern):  # type: ignore[union-attr]
-            raw = await self._redis.get(key)
-            if raw:
-                data = json.loads(raw)
-                if data.get("org_id") == org_id:
-                    await self._redis.delete(key)
-                    revoked += 1
+        """Revoke all SSO sessions for an organization.
+
+        Only the session ids read from the org index are removed from it,
+        so a login racing this call keeps its index entry for the next revoke.
+        """
+        await self._ensure_session_index()
+        index_key = f"{_ORG_SESSIONS_PREFIX}{org_id}"
+        session_ids = [
+            sid.decode() if isinstance(sid, bytes) else sid
+            for sid in await self._redis.zrange(index_key, 0, -1)
+        ]
+        if not session_ids:
+            return 0
+        pipe = self._redis.pipeline()
+        pipe.delete(*(f"{_REDIS_PREFIX}session:{sid}" for sid in session_ids))
+        pipe.zrem(index_key, *session_ids)
+        revoked, _ = await pipe.execute()
         return revoked
 
+    async def _ensure_session_index(self) -> None:
+        """Index sessions created before the org index existed (runs once).
+
+        Scans the session keyspace a single time, in batches of
+        _BACKFILL_BATCH, adding each session to its org index with its
+        remaining TTL, then records that the backfill is done so later
+        revokes cost only an EXISTS.
+        """
+        if await self._redis.exists(_ORG_SESSIONS_BACKFILLED_KEY):
+            return
+        batch: list[Any] = []
+        async for key in self._redis.scan_iter(  # type: ignore[union-attr]
+            match=f"{_REDIS_PREFIX}session:*", count=_BACKFILL_BATCH
+        ):
+            batch.append(key)
+            if len(batch) >= _BACKFILL_BATCH:
+                await self._backfill_session_batch(batch)
+                batch = []
+        if batch:
+            await self._backfill_session_batch(batch)
+        await self._redis.set(_ORG_SESSIONS_BACKFILLED_KEY, 1)
+
+    async def _backfill_session_batch(self, keys: list[Any]) -> None:
+        """Add one batch of session keys to their org indexes."""
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.mget(keys)
+        for key in keys:
+            pipe.ttl(key)
+        raw_sessions, *ttls = await pipe.execute()
+
+        now = time.time()
+        by_org: dict[str, dict[str, float]] = {}
+        for raw, ttl in zip(raw_sessions, ttls, strict=True):
+            if raw is None or ttl <= 0:
+                continue
+            data = json.loads(raw)
+            by_org.setdefault(data["org_id"], {})[data["session_id"]] = now + ttl
+
+        if not by_org:
+            return
+        pipe = self._redis.pipeline(transaction=False)
+        for org_id, entries in by_org.items():
+            index_key = f"{_ORG_SESSIONS_PREFIX}{org_id}"
+            # NX: never shorten an entry a concurrent login just wrote
+            pipe.zadd(index_key, entries, nx=True)
+            pipe.expire(index_key, _SESSION_TTL)
+        await pipe.execute()
+
     # --- Private helpers ---
 
     def _build_saml_request(self, config: SSOConfig, nonce: str, state: str) -> str:
@@ -257,7 +327,7 @@ class SSOService:
             f"&scope=openid+email+profile"
         )
 
-    def _build_github_oauth_url(self, config: SSOConfig, state: str) -> str:
+    def _build_github_oauth_url(self, config: SSOConfig, nonce: str, state: str) -> str:
         """Build GitHub OAuth authorization URL."""
         return (
             f"https://github.com/login/oauth/authorize"
@@ -12,7 +12,15 @@ SECURITY:
 
 from __future__ import annotations
 
+import hashlib
+import hmac
+import json
+import time
+from collections.abc import Mapping
 from enum import Enum
+from functools import lru_cache
+from importlib.util import find_spec
+from types import MappingProxyType
 from typing import Any
 
 import httpx
@@ -43,43 +51,88 @@ class PaymentError(GPSBaseError):
         )
 
 
-# Stripe product configuration
-TIER_PRODUCTS = {
-    UserTier.PRO: {
-        "name": "Git Phantom Scope Pro",
-        "description": "10+ premium templates, custom styles, priority generation",
-        "price_monthly_cents": 999,  # $9.99/month
-        "price_yearly_cents": 9999,  # $99.99/year
-        "features": [
-            "All 13 image templates",
-            "5 README styles",
-            "Custom color palettes",
-            "Priority generation queue",
-            "No watermark",
-            "BYOK support (all providers)",
-        ],
-    },
-    UserTier.ENTERPRISE: {
-        "name": "Git Phantom Scope Enterprise",
-        "description": "White-label, team analytics, API access, SLA",
-        "price_monthly_cents": 4999,  # $49.99/month
-        "price_yearly_cents": 49999,  # $499.99/year
-        "features": [
-            "Everything in Pro",
-            "White-label configuration",
-            "Team/org dashboard",
-            "Dedicated API access",
-            "Priority support & SLA",
-            "Custom templates",
-        ],
-    },
+# Stripe product configuration (read-only; shared by every request)
+TIER_PRODUCTS: Mapping[UserTier, Mapping[str, Any]] = MappingProxyType(
+    {
+        UserTier.PRO: MappingProxyType(
+            {
+                "name": "Git Phantom Scope Pro",
+                "description": "10+ premium templates, custom styles, priority generation",
+                "price_monthly_cents": 999,  # $9.99/month
+                "price_yearly_cents": 9999,  # $99.99/year
+                "features": (
+                    "All 13 image templates",
+                    "5 README styles",
+                    "Custom color palettes",
+                    "Priority generation queue",
+                    "No watermark",
+                    "BYOK support (all providers)",
+                ),
+            }
+        ),
+        UserTier.ENTERPRISE: MappingProxyType(
+            {
+                "name": "Git Phantom Scope Enterprise",
+                "description": "White-label, team analytics, API access, SLA",
+                "price_monthly_cents": 4999,  # $49.99/month
+                "price_yearly_cents": 49999,  # $499.99/year
+                "features": (
+                    "Everything in Pro",
+                    "White-label configuration",
+                    "Team/org dashboard",
+                    "Dedicated API access",
+                    "Priority support & SLA",
+                    "Custom templates",
+                ),
+            }
+        ),
+    }
+)
+
+
+def _checkout_template(
+    product: Mapping[str, Any], period: str, interval: str
+) -> tuple[int, dict[str, str]]:
+    """Build the static Checkout form fields for one product and billing period."""
+    price_cents = product[f"price_{period}_cents"]
+    return price_cents, {
+        "mode": "subscription",
+        "line_items[0][price_data][currency]": "usd",
+        "line_items[0][price_data][unit_amount]": str(price_cents),
+        "line_items[0][price_data][recurring][interval]": interval,
+        "line_items[0][price_data][product_data][name]": product["name"],
+        "line_items[0][price_data][product_data][description]": product["description"],
+        "line_items[0][quantity]": "1",
+    }
+
+
+# (tier, billing_period) -> (price_cents, static form fields); any period
+# other than "monthly" bills yearly
+_CHECKOUT_TEMPLATES: dict[tuple[UserTier, str], tuple[int, dict[str, str]]] = {
+    (tier, period): _checkout_template(product, period, interval)
+    for tier, product in TIER_PRODUCTS.items()
+    for period, interval in (("monthly", "month"), ("yearly", "year"))
 }
 
+# Keep-alive pool shared by all calls of one StripeService
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+# HTTP/2 multiplexes concurrent Stripe calls over one connection; needs httpx[http2]
+_HTTP2 = find_spec("h2") is not None
+
+
+@lru_cache(maxsize=4)
+def _webhook_hmac(webhook_secret: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 template for a webhook secret; copy() before use."""
+    return hmac.new(webhook_secret.encode(), None, hashlib.sha256)
+
 
 class StripeService:
     """Stripe payment and subscription management.
 
-    All Stripe API calls are async via httpx.
+    All Stripe API calls are async via httpx over one pooled client,
+    created on first use and released with ``aclose()``. Use the
+    process-wide instance from ``app.dependencies.get_stripe_service``;
+    it is closed by the app lifespan.
     Falls back gracefully when Stripe is not configured.
     """
 
@@ -93,6 +146,7 @@ class StripeService:
             if key:
                 self._api_key = key.get_secret_value()
         self._enabled = bool(self._api_key)
+        self._client: httpx.AsyncClient | None = None
 
     @property
     def is_enabled(self) -> bool:
@@ -106,6 +160,24 @@ class StripeService:
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled Stripe client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.STRIPE_API_BASE,
+                headers=self._headers(),
+                timeout=30.0,
+                limits=_HTTP_LIMITS,
+                http2=_HTTP2,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def create_checkout_session(
         self,
         tier: UserTier,
@@ -132,39 +204,23 @@ class StripeService:
         if tier == UserTier.FREE:
             raise PaymentError("Cannot purchase free tier")
 
-        product = TIER_PRODUCTS.get(tier)
-        if not product:
-            raise PaymentError("Invalid tier")
-
-        price_cents = (
-            product["price_monthly_cents"]
-            if billing_period == "monthly"
-            else product["price_yearly_cents"]
+        template = _CHECKOUT_TEMPLATES.get(
+            (tier, "monthly" if billing_period == "monthly" else "yearly")
         )
+        if template is None:
+            raise PaymentError("Invalid tier")
+        price_cents, static_fields = template
 
         form_data = {
-            "mode": "subscription",
+            **static_fields,
             "success_url": success_url + "?session_id={CHECKOUT_SESSION_ID}",
             "cancel_url": cancel_url,
-            "line_items[0][price_data][currency]": "usd",
-            "line_items[0][price_data][unit_amount]": str(price_cents),
-            "line_items[0][price_data][recurring][interval]": (
-                "month" if billing_period == "monthly" else "year"
-            ),
-            "line_items[0][price_data][product_data][name]": product["name"],
-            "line_items[0][price_data][product_data][description]": product["description"],
-            "line_items[0][quantity]": "1",
             "metadata[gps_session_id]": session_id,
             "metadata[gps_tier]": tier.value,
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.STRIPE_API_BASE}/checkout/sessions",
-                    headers=self._headers(),
-                    data=form_data,
-                )
+            response = await self._get_client().post("/checkout/sessions", data=form_data)
 
             if response.status_code != 200:
                 logger.warning(
@@ -208,12 +264,7 @@ class StripeService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.STRIPE_API_BASE}/billing_portal/sessions",
-                    headers=self._headers(),
-                    data=form_data,
-                )
+            response = await self._get_client().post("/billing_portal/sessions", data=form_data)
 
             if response.status_code != 200:
                 raise PaymentError("Portal session creation failed")
@@ -242,15 +293,12 @@ class StripeService:
         Returns:
             Parsed webhook event dict.
         """
-        import hashlib
-        import hmac
-        import time as time_mod
-
         # Parse Stripe signature header (t=timestamp,v1=signature)
-        sig_parts: dict[str, str] = {}
-        for part in signature.split(","):
-            key, _, value = part.partition("=")
-            sig_parts[key.strip()] = value.strip()
+        # Fields without "=" map to "" and fail below
+        sig_parts = {
+            key.strip(): value.strip()
+            for key, _, value in (part.partition("=") for part in signature.split(","))
+        }
 
         timestamp = sig_parts.get("t", "")
         v1_sig = sig_parts.get("v1", "")
@@ -264,22 +312,23 @@ class StripeService:
         except ValueError:
             raise PaymentError("Invalid webhook timestamp")
 
-        if abs(time_mod.time() - ts) > 300:
+        if abs(time.time() - ts) > 300:
             raise PaymentError("Webhook timestamp too old")
 
-        # Compute expected signature
-        signed_payload = f"{timestamp}.".encode() + payload
-        expected_sig = hmac.new(
-            webhook_secret.encode(),
-            signed_payload,
-            hashlib.sha256,
-        ).hexdigest()
-
-        # Constant-time comparison
-        if not hmac.compare_digest(expected_sig, v1_sig):
+        try:
+            received_digest = bytes.fromhex(v1_sig)
+        except ValueError:
             raise PaymentError("Webhook signature verification failed")
 
-        import json
+        # Compute expected signature
+        mac = _webhook_hmac(webhook_secret).copy()
+        mac.update(f"{timestamp}.".encode())
+        mac.update(payload)
+        expected_digest = mac.digest()
+
+        # Constant-time comparison on the raw 32-byte digests
+        if not hmac.compare_digest(expected_digest, received_digest):
+            raise PaymentError("Webhook signature verification failed")
 
         return json.loads(payload)
 
@@ -298,8 +347,18 @@ class StripeService:
         return metadata.get("gps_session_id")
 
 
-def get_tier_features(tier: UserTier) -> dict[str, Any]:
-    """Get features and limits for a subscription tier."""
+@lru_cache(maxsize=len(UserTier))
+def get_tier_features(tier: UserTier) -> Mapping[str, Any]:
+    """Get features and limits for a subscription tier.
+
+    Cached per tier; the returned mapping is a read-only view shared by
+    all callers.
+    """
+    return MappingProxyType(_build_tier_features(tier))
+
+
+def _build_tier_features(tier: UserTier) -> dict[str, Any]:
+    """Build the features and limits dict for a subscription tier."""
     if tier == UserTier.FREE:
         return {
             "tier": "free",
@@ -307,7 +366,7 @@ def get_tier_features(tier: UserTier) -> dict[str, Any]:
             "readme_styles": 2,
             "watermark": True,
             "custom_colors": False,
-            "byok_providers": ["gemini"],
+            "byok_providers": ("gemini",),
             "rate_limit_generate_per_day": 5,
             "priority_queue": False,
         }
@@ -318,7 +377,7 @@ def get_tier_features(tier: UserTier) -> dict[str, Any]:
             "readme_styles": 5,
             "watermark": False,
             "custom_colors": True,
-            "byok_providers": ["gemini", "openai", "stable_diffusion", "flux"],
+            "byok_providers": ("gemini", "openai", "stable_diffusion", "flux"),
             "rate_limit_generate_per_day": 50,
             "priority_queue": True,
         }
@@ -329,7 +388,7 @@ def get_tier_features(tier: UserTier) -> dict[str, Any]:
         "watermark": False,
         "custom_colors": True,
         "custom_templates": True,
-        "byok_providers": ["gemini", "openai", "stable_diffusion", "flux"],
+        "byok_providers": ("gemini", "openai", "stable_diffusion", "flux"),
         "rate_limit_generate_per_day": 500,
         "priority_queue": True,
         "api_access": True,
@@ -10,13 +10,13 @@ Team membership is tracked via hashed org_id in Redis (session-scoped).
 
 from __future__ import annotations
 
-import json
-from datetime import UTC, datetime
+from collections import Counter
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from app.clock import utc_now_iso
 from app.config import get_settings
 from app.exceptions import GPSBaseError
 
@@ -52,7 +52,7 @@ class TeamMemberSummary(BaseModel):
     archetype: str = Field(default="code_explorer")
     ai_tools_detected: list[str] = Field(default_factory=list)
     top_languages: list[str] = Field(default_factory=list)
-    analyzed_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
+    analyzed_at: str = Field(default_factory=utc_now_iso)
 
 
 class TeamDashboard(BaseModel):
@@ -67,7 +67,7 @@ class TeamDashboard(BaseModel):
     top_languages: list[dict[str, Any]] = Field(default_factory=list)
     ai_tools_usage: dict[str, int] = Field(default_factory=dict)
     score_trends: list[dict[str, Any]] = Field(default_factory=list)
-    generated_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
+    generated_at: str = Field(default_factory=utc_now_iso)
 
 
 _REDIS_PREFIX = "team:"
@@ -85,13 +85,14 @@ class TeamAnalyticsService:
     async def add_member_analysis(self, org_id: str, member_summary: TeamMemberSummary) -> str:
         """Add a team member's anonymous analysis to the org dashboard."""
         member_key = f"{_MEMBER_PREFIX}{org_id}:{member_summary.member_hash}"
-        data = member_summary.model_dump(mode="json")
-        await self._redis.setex(member_key, _DASHBOARD_TTL, json.dumps(data))
-
-        # Track member in org set
         org_set_key = f"{_REDIS_PREFIX}{org_id}:members"
-        await self._redis.sadd(org_set_key, member_summary.member_hash)
-        await self._redis.expire(org_set_key, _DASHBOARD_TTL)
+
+        # Store the summary and track the member in the org set in one round-trip
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.setex(member_key, _DASHBOARD_TTL, member_summary.model_dump_json())
+        pipe.sadd(org_set_key, member_summary.member_hash)
+        pipe.expire(org_set_key, _DASHBOARD_TTL)
+        await pipe.execute()
 
         return member_summary.member_hash
 
@@ -104,34 +105,29 @@ class TeamAnalyticsService:
         if not members:
             return TeamDashboard(org_id=org_id, period=period.value)
 
-        # Aggregate scores
-        all_scores: dict[str, list[float]] = {}
-        archetypes: dict[str, int] = {}
-        all_languages: dict[str, int] = {}
-        all_ai_tools: dict[str, int] = {}
+        # Aggregate scores; each dimension averages over the members reporting it
+        score_sums: dict[str, float] = {}
+        score_counts: Counter[str] = Counter()
+        archetypes: Counter[str] = Counter(m.archetype for m in members)
+        all_languages: Counter[str] = Counter()
+        all_ai_tools: Counter[str] = Counter()
         ai_users = 0
 
         for member in members:
             for dim, score in member.scores.items():
-                all_scores.setdefault(dim, []).append(score)
-
-            archetypes[member.archetype] = archetypes.get(member.archetype, 0) + 1
-
-            for lang in member.top_languages:
-                all_languages[lang] = all_languages.get(lang, 0) + 1
-
-            for tool in member.ai_tools_detected:
-                all_ai_tools[tool] = all_ai_tools.get(tool, 0) + 1
-
-            if member.ai_tools_detected:
-                ai_users += 1
+                score_sums[dim] = score_sums.get(dim, 0) + score
+            score_counts.update(member.scores.keys())
+            all_languages.update(member.top_languages)
+            all_ai_tools.update(member.ai_tools_detected)
+            ai_users += bool(member.ai_tools_detected)
 
         # Calculate averages
-        avg_scores = {dim: round(sum(vals) / len(vals), 1) for dim, vals in all_scores.items()}
+        avg_scores = {dim: round(total / score_counts[dim], 1) for dim, total in score_sums.items()}
 
         # Sort languages by frequency
-        sorted_langs = sorted(all_languages.items(), key=lambda x: x[1], reverse=True)
-        top_languages = [{"language": lang, "count": count} for lang, count in sorted_langs[:10]]
+        top_languages = [
+            {"language": lang, "count": count} for lang, count in all_languages.most_common(10)
+        ]
 
         team_size = len(members)
         ai_rate = round(ai_users / team_size * 100, 1) if team_size > 0 else 0
@@ -141,10 +137,10 @@ class TeamAnalyticsService:
             team_size=team_size,
             period=period.value,
             aggregate_scores=avg_scores,
-            archetype_distribution=archetypes,
+            archetype_distribution=dict(archetypes),
             ai_adoption_rate=ai_rate,
             top_languages=top_languages,
-            ai_tools_usage=all_ai_tools,
+            ai_tools_usage=dict(all_ai_tools),
         )
 
     async def get_team_comparison(self, org_id: str) -> list[dict[str, Any]]:
@@ -169,13 +165,15 @@ class TeamAnalyticsService:
 
     async def clear_team(self, org_id: str) -> int:
         """Clear all team analytics data."""
-        members = await self._get_member_hashes(org_id)
-        deleted = 0
-        for member_hash in members:
-            key = f"{_MEMBER_PREFIX}{org_id}:{member_hash}"
-            deleted += await self._redis.delete(key)
+        keys = self._member_keys(org_id, await self._get_member_hashes(org_id))
         org_set_key = f"{_REDIS_PREFIX}{org_id}:members"
-        await self._redis.delete(org_set_key)
+        if not keys:
+            await self._redis.delete(org_set_key)
+            return 0
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.delete(*keys)
+        pipe.delete(org_set_key)
+        deleted, _ = await pipe.execute()
         return deleted
 
     async def _get_member_hashes(self, org_id: str) -> list[str]:
@@ -184,14 +182,18 @@ class TeamAnalyticsService:
         raw_members = await self._redis.smembers(org_set_key)
         return [m.decode() if isinstance(m, bytes) else m for m in raw_members]
 
+    @staticmethod
+    def _member_keys(org_id: str, hashes: list[str]) -> list[str]:
+        """Build the Redis keys holding each member's summary."""
+        return [f"{_MEMBER_PREFIX}{org_id}:{member_hash}" for member_hash in hashes]
+
     async def _get_members(self, org_id: str) -> list[TeamMemberSummary]:
-        """Load all member summaries for an org."""
-        hashes = await self._get_member_hashes(org_id)
+        """Load all member summaries for an org in a single MGET."""
+        keys = self._member_keys(org_id, await self._get_member_hashes(org_id))
+        if not keys:
+            return []
         members: list[TeamMemberSummary] = []
-        for member_hash in hashes:
-            key = f"{_MEMBER_PREFIX}{org_id}:{member_hash}"
-            raw = await self._redis.get(key)
+        for raw in await self._redis.mget(keys):
             if raw:
-                data = json.loads(raw)
-                members.append(TeamMemberSummary.model_validate(data))
+                members.append(TeamMemberSummary.model_validate_json(raw))
         return members
@@ -10,8 +10,8 @@ or PostgreSQL (for persistent enterprise accounts).
 
 from __future__ import annotations
 
-import json
 import re
+import time
 from enum import Enum
 from typing import Any
 
@@ -40,6 +40,20 @@ class BrandTheme(str, Enum):
     CUSTOM = "custom"
 
 
+_DOMAIN_RE = re.compile(r"^([a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$")
+
+# All dangerous CSS constructs in one alternation, so validation is a single scan
+_DANGEROUS_CSS_RE = re.compile(
+    r"javascript\s*:"
+    r"|expression\s*\("
+    r"|url\s*\(\s*['\"]?\s*javascript"
+    r"|@import"
+    r"|behavior\s*:"
+    r"|-moz-binding",
+    re.IGNORECASE,
+)
+
+
 class WhiteLabelConfig(BaseModel):
     """White-label branding configuration."""
 
@@ -68,8 +82,7 @@ class WhiteLabelConfig(BaseModel):
     def validate_domain(cls, v: str | None) -> str | None:
         if v is None:
             return v
-        pattern = r"^([a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$"
-        if not re.match(pattern, v):
+        if not _DOMAIN_RE.match(v):
             raise ValueError("Invalid domain format")
         return v.lower()
 
@@ -78,23 +91,20 @@ class WhiteLabelConfig(BaseModel):
     def sanitize_css(cls, v: str | None) -> str | None:
         if v is None:
             return v
-        dangerous_patterns = [
-            r"javascript\s*:",
-            r"expression\s*\(",
-            r"url\s*\(\s*['\"]?\s*javascript",
-            r"@import",
-            r"behavior\s*:",
-            r"-moz-binding",
-        ]
-        for pattern in dangerous_patterns:
-            if re.search(pattern, v, re.IGNORECASE):
-                raise ValueError("CSS contains potentially dangerous content")
+        if _DANGEROUS_CSS_RE.search(v):
+            raise ValueError("CSS contains potentially dangerous content")
         return v
 
 
 _REDIS_PREFIX = "whitelabel:"
+_INDEX_KEY = "whitelabel_index"  # zset: org_id -> config expiry
+# Set once configs saved before the index existed have been indexed
+_INDEX_BACKFILLED_KEY = "whitelabel_index_backfilled"
 _CONFIG_TTL = 86400  # 24 hours
 
+# Per-service cache in front of Redis holds at most this many orgs
+_CONFIG_CACHE_SIZE = 1024
+
 
 class WhiteLabelService:
     """Manages white-label configurations for enterprise customers."""
@@ -102,27 +112,55 @@ class WhiteLabelService:
     def __init__(self, redis_client: Any) -> None:
         self._redis = redis_client
         self._settings = get_settings()
+        # org_id -> (monotonic expiry, config or None). Entries live
+        # settings.whitelabel_cache_ttl seconds, so a save made through
+        # another service or worker shows up here within that window.
+        self._config_cache: dict[str, tuple[float, WhiteLabelConfig | None]] = {}
 
     async def save_config(self, config: WhiteLabelConfig) -> dict[str, str]:
         """Save white-label configuration to Redis."""
         key = f"{_REDIS_PREFIX}{config.org_id}"
-        data = config.model_dump(mode="json")
-        await self._redis.setex(key, _CONFIG_TTL, json.dumps(data))
+        await self._ensure_index()
+        now = time.time()
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.setex(key, _CONFIG_TTL, config.model_dump_json())
+        pipe.zremrangebyscore(_INDEX_KEY, 0, now)
+        pipe.zadd(_INDEX_KEY, {config.org_id: now + _CONFIG_TTL})
+        await pipe.execute()
+        self._config_cache.pop(config.org_id, None)
         return {"status": "saved", "org_id": config.org_id}
 
     async def get_config(self, org_id: str) -> WhiteLabelConfig | None:
-        """Retrieve white-label configuration."""
+        """Retrieve white-label configuration.
+
+        Served from a short-lived in-process cache when possible; the
+        returned config is shared and must not be mutated.
+        """
+        ttl = self._settings.whitelabel_cache_ttl
+        now = time.monotonic()
+        cached = self._config_cache.get(org_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
         key = f"{_REDIS_PREFIX}{org_id}"
         raw = await self._redis.get(key)
-        if raw is None:
-            return None
-        data = json.loads(raw)
-        return WhiteLabelConfig.model_validate(data)
+        config = None if raw is None else WhiteLabelConfig.model_validate_json(raw)
+        if ttl > 0:
+            self._config_cache.pop(org_id, None)
+            if len(self._config_cache) >= _CONFIG_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._config_cache.pop(next(iter(self._config_cache)), None)
+            self._config_cache[org_id] = (now + ttl, config)
+        return config
 
     async def delete_config(self, org_id: str) -> bool:
         """Delete white-label configuration."""
         key = f"{_REDIS_PREFIX}{org_id}"
-        result = await self._redis.delete(key)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.delete(key)
+        pipe.zrem(_INDEX_KEY, org_id)
+        result, _ = await pipe.execute()
+        self._config_cache.pop(org_id, None)
         return result > 0
 
     async def get_css_variables(self, org_id: str) -> dict[str, str]:
@@ -130,16 +168,7 @@ class WhiteLabelService:
         config = await self.get_config(org_id)
         if config is None:
             return _default_css_vars()
-        return {
-            "--gps-bg": config.background_color,
-            "--gps-surface": config.surface_color,
-            "--gps-border": "#30363D",
-            "--gps-text": config.text_color,
-            "--gps-accent": config.primary_color,
-            "--gps-green": config.secondary_color,
-            "--gps-purple": config.accent_color,
-            "--gps-font": config.font_family,
-        }
+        return _css_vars(config)
 
     async def get_branding(self, org_id: str) -> dict[str, Any]:
         """Get full branding info for frontend rendering."""
@@ -151,7 +180,7 @@ class WhiteLabelService:
             "logo_url": config.logo_url,
             "favicon_url": config.favicon_url,
             "theme": config.theme.value,
-            "css_variables": await self.get_css_variables(org_id),
+            "css_variables": _css_vars(config),
             "footer_text": config.footer_text,
             "hide_powered_by": config.hide_powered_by,
             "custom_css": config.custom_css,
@@ -159,13 +188,59 @@ class WhiteLabelService:
         }
 
     async def list_configs(self) -> list[str]:
-        """List all org IDs with white-label configs."""
-        pattern = f"{_REDIS_PREFIX}*"
-        keys: list[bytes] = []
-        async for key in self._redis.scan_iter(match=pattern):  # type: ignore[union-attr]
-            keys.append(key)
-        prefix_len = len(_REDIS_PREFIX)
-        return [k.decode()[prefix_len:] if isinstance(k, bytes) else k[prefix_len:] for k in keys]
+        """List all org IDs with white-label configs.
+
+        Reads the expiry-scored index instead of scanning the keyspace.
+        """
+        await self._ensure_index()
+        members = await self._redis.zrangebyscore(_INDEX_KEY, time.time(), "+inf")
+        return [m.decode() if isinstance(m, bytes) else m for m in members]
+
+    async def _ensure_index(self) -> None:
+        """Index configs saved before the org index existed (runs once).
+
+        Falls back to the old keyspace SCAN a single time, adding each
+        existing config with its remaining TTL, then records that the
+        backfill is done so later calls cost only an EXISTS.
+        """
+        if await self._redis.exists(_INDEX_BACKFILLED_KEY):
+            return
+        keys = [
+            key
+            async for key in self._redis.scan_iter(  # type: ignore[union-attr]
+                match=f"{_REDIS_PREFIX}*"
+            )
+        ]
+        if keys:
+            pipe = self._redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.ttl(key)
+            ttls = await pipe.execute()
+            now = time.time()
+            prefix_len = len(_REDIS_PREFIX)
+            entries = {
+                (key.decode() if isinstance(key, bytes) else key)[prefix_len:]: now + ttl
+                for key, ttl in zip(keys, ttls, strict=True)
+                if ttl > 0
+            }
+            if entries:
+                # NX: never shorten an entry a concurrent save just wrote
+                await self._redis.zadd(_INDEX_KEY, entries, nx=True)
+        await self._redis.set(_INDEX_BACKFILLED_KEY, 1)
+
+
+def _css_vars(config: WhiteLabelConfig) -> dict[str, str]:
+    """CSS custom properties for a white-label config."""
+    return {
+        "--gps-bg": config.background_color,
+        "--gps-surface": config.surface_color,
+        "--gps-border": "#30363D",
+        "--gps-text": config.text_color,
+        "--gps-accent": config.primary_color,
+        "--gps-green": config.secondary_color,
+        "--gps-purple": config.accent_color,
+        "--gps-font": config.font_family,
+    }
 
 
 def _default_css_vars() -> dict[str, str]:
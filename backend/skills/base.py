@@ -11,10 +11,11 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from app.clock import utc_now_iso
+
 
 class SkillStatus(str, Enum):
     """Skill execution status."""
@@ -25,7 +26,7 @@ class SkillStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMetadata:
     """Metadata for a skill definition."""
 
@@ -37,7 +38,7 @@ class SkillMetadata:
     requires: list[str] = field(default_factory=list)  # Required dependencies
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillContext:
     """Context passed to skill execution.
 
@@ -54,7 +55,7 @@ class SkillContext:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillResult:
     """Result of a skill execution."""
 
@@ -62,12 +63,27 @@ class SkillResult:
     data: dict[str, Any] = field(default_factory=dict)
     errors: list[str] = field(default_factory=list)
     duration_ms: float = 0.0
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = field(default_factory=utc_now_iso)
 
     @property
     def is_success(self) -> bool:
         return self.status == SkillStatus.SUCCESS
 
+    @classmethod
+    def success(cls, data: dict[str, Any] | None = None, duration_ms: float = 0.0) -> SkillResult:
+        """Build a successful result, passing every field positionally."""
+        return cls(SkillStatus.SUCCESS, {} if data is None else data, [], duration_ms)
+
+    @classmethod
+    def failed(
+        cls,
+        *errors: str,
+        status: SkillStatus = SkillStatus.FAILED,
+        duration_ms: float = 0.0,
+    ) -> SkillResult:
+        """Build a failed (or skipped) result carrying ``errors``."""
+        return cls(status, {}, list(errors), duration_ms)
+
 
 class SkillBase(ABC):
     """Abstract base class for all skills."""
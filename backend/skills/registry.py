@@ -7,6 +7,10 @@ from the skills directory.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 from app.logging_config import get_logger
 from skills.base import SkillBase, SkillContext, SkillResult, SkillStatus
 
@@ -18,6 +22,9 @@ class SkillRegistry:
 
     def __init__(self) -> None:
         self._skills: dict[str, SkillBase] = {}
+        # Frozen list_skills()/list_skill_summaries() output, rebuilt lazily after register()
+        self._skills_cache: tuple[Mapping[str, Any], ...] | None = None
+        self._summaries_cache: tuple[tuple[str, str], ...] | None = None
 
     def register(self, skill: SkillBase) -> None:
         """Register a skill instance."""
@@ -25,6 +32,8 @@ class SkillRegistry:
         if name in self._skills:
             logger.warning("skill_already_registered", skill=name)
         self._skills[name] = skill
+        self._skills_cache = None
+        self._summaries_cache = None
         logger.info(
             "skill_registered",
             skill=name,
@@ -35,40 +44,52 @@ class SkillRegistry:
         """Get a skill by name."""
         return self._skills.get(name)
 
-    def list_skills(self) -> list[dict[str, str]]:
-        """List all registered skills with metadata."""
-        return [
-            {
-                "name": s.metadata.name,
-                "version": s.metadata.version,
-                "description": s.metadata.description,
-                "author": s.metadata.author,
-                "tags": s.metadata.tags,
-            }
-            for s in self._skills.values()
-        ]
+    def list_skills(self) -> tuple[Mapping[str, Any], ...]:
+        """List all registered skills with metadata.
+
+        The result is cached until the next register() and is read-only.
+        """
+        if self._skills_cache is None:
+            self._skills_cache = tuple(
+                MappingProxyType(
+                    {
+                        "name": s.metadata.name,
+                        "version": s.metadata.version,
+                        "description": s.metadata.description,
+                        "author": s.metadata.author,
+                        "tags": tuple(s.metadata.tags),
+                    }
+                )
+                for s in self._skills.values()
+            )
+        return self._skills_cache
+
+    def list_skill_summaries(self) -> tuple[tuple[str, str], ...]:
+        """List (name, version) for every registered skill.
+
+        Lightweight variant of list_skills() for discovery and health
+        checks; cached until the next register().
+        """
+        if self._summaries_cache is None:
+            self._summaries_cache = tuple(
+                (s.metadata.name, s.metadata.version) for s in self._skills.values()
+            )
+        return self._summaries_cache
 
     async def execute(self, name: str, context: SkillContext) -> SkillResult:
         """Execute a skill by name."""
         skill = self.get(name)
         if not skill:
-            return SkillResult(
-                status=SkillStatus.FAILED,
-                errors=[f"Skill not found: {name}"],
-            )
+            return SkillResult.failed(f"Skill not found: {name}")
 
         # Validate
         try:
             if not await skill.validate(context):
-                return SkillResult(
-                    status=SkillStatus.SKIPPED,
-                    errors=[f"Skill validation failed: {name}"],
+                return SkillResult.failed(
+                    f"Skill validation failed: {name}", status=SkillStatus.SKIPPED
                 )
         except Exception as e:
-            return SkillResult(
-                status=SkillStatus.FAILED,
-                errors=[f"Validation error: {str(e)}"],
-            )
+            return SkillResult.failed(f"Validation error: {str(e)}")
 
         # Execute
         import time
@@ -87,11 +108,7 @@ class SkillRegistry:
         except Exception as e:
             duration = (time.perf_counter() - start) * 1000
             logger.exception("skill_execution_failed", skill=name)
-            return SkillResult(
-                status=SkillStatus.FAILED,
-                errors=[str(e)],
-                duration_ms=duration,
-            )
+            return SkillResult.failed(str(e), duration_ms=duration)
 
     async def execute_pipeline(
         self, skill_names: list[str], context: SkillContext
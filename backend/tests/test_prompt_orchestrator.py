@@ -1,5 +1,10 @@
 """Tests for PromptOrchestrator."""
 
+import copy
+import json
+import pickle
+from collections.abc import Mapping
+
 import pytest
 
 from services.prompt_orchestrator import (
@@ -9,6 +14,11 @@ from services.prompt_orchestrator import (
     PRO_TEMPLATES,
     README_TEMPLATES,
     PromptOrchestrator,
+    ReadmePrompt,
+    SDPrompt,
+    _compile_template,
+    _prompt_fields,
+    _render_readme,
 )
 
 
@@ -55,6 +65,39 @@ def sample_profile():
     }
 
 
+class TestPromptFields:
+    def test_fields_are_joined_once(self, sample_scoring_result):
+        fields = _prompt_fields(sample_scoring_result)
+
+        assert fields.top_languages == "Python, TypeScript, Go"
+        assert fields.top_skills == "Python, TypeScript, Go"
+        assert fields.frameworks == "FastAPI, Next.js, React, TensorFlow"
+        assert fields.top_repos == "my-app (Python, 42 stars); web-ui (TypeScript, 15 stars)"
+
+    def test_empty_profile_uses_placeholders(self):
+        fields = _prompt_fields({})
+
+        assert fields.archetype_name == "Developer"
+        assert fields.top_languages == "Not specified"
+        assert fields.top_skills == ""
+        assert fields.top_repos == "Not specified"
+
+    def test_scoring_result_is_not_mutated(self, sample_scoring_result):
+        before = repr(sample_scoring_result)
+
+        _prompt_fields(sample_scoring_result)
+
+        assert repr(sample_scoring_result) == before
+
+
+class TestOrchestratorSingleton:
+    def test_singleton_has_no_instance_dict(self):
+        import services.prompt_orchestrator as mod
+
+        assert isinstance(mod.orchestrator, PromptOrchestrator)
+        assert not hasattr(mod.orchestrator, "__dict__")
+
+
 class TestReadmePromptBuilding:
     def test_build_readme_prompt_professional(self, orchestrator, sample_scoring_result):
         result = orchestrator.build_readme_prompt(
@@ -110,6 +153,52 @@ class TestReadmePromptBuilding:
 
         assert "Not specified" in result["user"]
 
+    def test_build_readme_prompt_repeat_call_is_cached(self, orchestrator, sample_scoring_result):
+        first = orchestrator.build_readme_prompt(sample_scoring_result, profile={})
+        hits = _render_readme.cache_info().hits
+
+        second = orchestrator.build_readme_prompt(sample_scoring_result, profile={})
+
+        assert _render_readme.cache_info().hits == hits + 1
+        assert second is first
+        with pytest.raises(TypeError):
+            first["user"] = "mutated by caller"
+
+    def test_readme_prompt_prefix_is_shared_across_profiles(
+        self, orchestrator, sample_scoring_result
+    ):
+        first = orchestrator.build_readme_prompt(sample_scoring_result, profile={})
+        other = orchestrator.build_readme_prompt(
+            {"archetype": {"name": "Code Explorer"}}, profile={}, career_goal="CTO"
+        )
+
+        assert first.user == first.user_prefix + first.user_suffix
+        assert first.user_prefix == other.user_prefix
+        assert "AI-Driven Indie Hacker" not in first.user_prefix
+        assert "AI-Driven Indie Hacker" in first.user_suffix
+
+    def test_readme_prompt_is_a_mapping(self, orchestrator, sample_scoring_result):
+        result = orchestrator.build_readme_prompt(sample_scoring_result, profile={})
+
+        assert isinstance(result, ReadmePrompt)
+        assert result["system"] == result.system
+        assert result.get("user") == result.user
+        assert result.get("missing", "") == ""
+        assert dict(result) == {"system": result.system, "user": result.user}
+        assert json.loads(json.dumps(result)) == dict(result)
+        with pytest.raises(KeyError):
+            result["missing"]
+        with pytest.raises(TypeError):
+            result.user_prefix = "changed"
+
+    def test_readme_prompt_pickles(self, orchestrator, sample_scoring_result):
+        result = orchestrator.build_readme_prompt(sample_scoring_result, profile={})
+        clone = pickle.loads(pickle.dumps(result))  # noqa: S301
+
+        assert clone == result
+        assert clone.user_prefix == result.user_prefix
+        assert clone.user_suffix == result.user_suffix
+
 
 class TestImagePromptBuilding:
     def test_build_image_prompt_gemini(self, orchestrator, sample_scoring_result):
@@ -184,12 +273,98 @@ class TestImagePromptBuilding:
         # Falls back to portfolio_banner
         assert isinstance(result, str)
 
+    def test_build_image_prompt_unknown_template_keeps_model_type(
+        self, orchestrator, sample_scoring_result
+    ):
+        result = orchestrator.build_image_prompt(
+            scoring_result=sample_scoring_result,
+            template_id="nonexistent",
+            model_type="stable_diffusion",
+        )
+
+        assert (
+            result["negative"]
+            == IMAGE_TEMPLATES["portfolio_banner"]["stable_diffusion"]["negative"]
+        )
+
+    def test_build_image_prompt_unknown_model_falls_back_to_gemini(
+        self, orchestrator, sample_scoring_result
+    ):
+        result = orchestrator.build_image_prompt(
+            scoring_result=sample_scoring_result,
+            template_id="skill_wheel",
+            model_type="dall-e",
+        )
+
+        assert isinstance(result, str)
+        assert "skill wheel" in result
+
+    def test_sd_prompt_is_cached_and_read_only(self, orchestrator, sample_scoring_result):
+        first = orchestrator.build_image_prompt(
+            sample_scoring_result, template_id="skill_wheel", model_type="stable_diffusion"
+        )
+        second = orchestrator.build_image_prompt(
+            sample_scoring_result, template_id="skill_wheel", model_type="stable_diffusion"
+        )
+
+        assert isinstance(first, SDPrompt)
+        assert second is first
+        with pytest.raises(TypeError):
+            first["positive"] = "tampered"
+        with pytest.raises(TypeError):
+            first.update(negative="")
+        assert copy.deepcopy(first) == first
+        assert pickle.loads(pickle.dumps(first)) == first  # noqa: S301
+
+    def test_sd_negative_is_returned_without_formatting(self, orchestrator, sample_scoring_result):
+        result = orchestrator.build_image_prompt(
+            scoring_result=sample_scoring_result,
+            template_id="skill_wheel",
+            model_type="stable_diffusion",
+            style="neon",
+        )
+
+        assert result["negative"] is IMAGE_TEMPLATES["skill_wheel"]["stable_diffusion"]["negative"]
+
+
+class TestPromptBundle:
+    def test_bundle_matches_individual_builds(self, orchestrator, sample_scoring_result):
+        bundle = orchestrator.build_bundle(
+            sample_scoring_result,
+            readme_styles=["professional", "creative"],
+            image_specs=[("portfolio_banner", "gemini"), ("skill_wheel", "stable_diffusion")],
+            career_goal="Become a Staff Engineer",
+            colors=["#FF0000"],
+        )
+
+        assert bundle["readmes"]["creative"] == orchestrator.build_readme_prompt(
+            sample_scoring_result,
+            profile={},
+            style="creative",
+            career_goal="Become a Staff Engineer",
+        )
+        assert bundle["images"][("skill_wheel", "stable_diffusion")] == (
+            orchestrator.build_image_prompt(
+                sample_scoring_result,
+                template_id="skill_wheel",
+                model_type="stable_diffusion",
+                colors=["#FF0000"],
+            )
+        )
+        assert "#FF0000" in bundle["images"][("portfolio_banner", "gemini")]
+
+    def test_bundle_empty_specs(self, orchestrator, sample_scoring_result):
+        bundle = orchestrator.build_bundle(sample_scoring_result, readme_styles=[], image_specs=[])
+        assert bundle == {"readmes": {}, "images": {}}
+
 
 class TestTemplateStructure:
     def test_readme_templates_have_required_keys(self):
         for style, template in README_TEMPLATES.items():
             assert "system" in template, f"Missing 'system' in {style}"
-            assert "user" in template, f"Missing 'user' in {style}"
+            assert "user_prefix" in template, f"Missing 'user_prefix' in {style}"
+            assert "user_suffix" in template, f"Missing 'user_suffix' in {style}"
+            assert "{" not in template["user_prefix"], f"Dynamic field in {style} prefix"
 
     def test_image_templates_have_all_models(self):
         for template_id, templates in IMAGE_TEMPLATES.items():
@@ -200,10 +375,39 @@ class TestTemplateStructure:
     def test_sd_templates_have_positive_negative(self):
         for _template_id, templates in IMAGE_TEMPLATES.items():
             sd = templates["stable_diffusion"]
-            assert isinstance(sd, dict)
+            assert isinstance(sd, Mapping)
             assert "positive" in sd
             assert "negative" in sd
 
+    def test_compiled_templates_match_str_format(self):
+        fields = {
+            "archetype_name": "Builder",
+            "archetype_description": "Ships {things}",
+            "top_languages": "Python",
+            "frameworks": "FastAPI",
+            "activity_score": 75,
+            "collab_score": 60.5,
+            "diversity_score": 0,
+            "ai_score": 90,
+            "top_repos": "app (Python, 3 stars)",
+            "career_goal_section": "",
+            "style": "minimal",
+            "top_skills": "Python, Go",
+            "colors": "#000000",
+        }
+        templates = [t["user_suffix"] for t in README_TEMPLATES.values()]
+        for template_set in IMAGE_TEMPLATES.values():
+            templates += [template_set["gemini"], template_set["flux"]]
+            templates += list(template_set["stable_diffusion"].values())
+
+        for template in templates:
+            assert _compile_template(template)(**fields) == template.format(**fields)
+
+    def test_compile_template_falls_back_for_format_specs(self):
+        render = _compile_template("{score:>5} {name!r}")
+
+        assert render(score=7, name="x") == "    7 'x'"
+
 
 class TestTierClassification:
     def test_free_templates_count(self):
@@ -240,6 +444,17 @@ class TestTierClassification:
             assert "tier" in templates, f"Missing tier in {template_id}"
             assert templates["tier"] in ("free", "pro")
 
+    def test_template_registries_are_read_only(self):
+        with pytest.raises(TypeError):
+            README_TEMPLATES["rogue"] = {}  # type: ignore[index]
+        with pytest.raises(TypeError):
+            IMAGE_TEMPLATES["rogue"] = {}  # type: ignore[index]
+        with pytest.raises(TypeError):
+            README_TEMPLATES["professional"]["tier"] = "free"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            IMAGE_TEMPLATES["neon_circuit"]["stable_diffusion"]["negative"] = ""  # type: ignore[index]
+        assert isinstance(ALL_TEMPLATES, frozenset)
+
     def test_readme_templates_have_tier_field(self):
         for style, template in README_TEMPLATES.items():
             assert "tier" in template, f"Missing tier in {style}"
@@ -259,6 +474,11 @@ class TestTierHelpers:
         templates = PromptOrchestrator.get_available_templates("enterprise")
         assert set(templates) == ALL_TEMPLATES
 
+    def test_get_available_templates_is_sorted(self):
+        templates = PromptOrchestrator.get_available_templates("pro")
+        assert list(templates) == sorted(ALL_TEMPLATES)
+        assert templates is PromptOrchestrator.get_available_templates("enterprise")
+
     def test_get_available_readme_styles_free(self):
         styles = PromptOrchestrator.get_available_readme_styles("free")
         assert "professional" in styles
@@ -290,6 +510,10 @@ class TestTierHelpers:
     def test_is_readme_style_allowed_free_on_free(self):
         assert PromptOrchestrator.is_readme_style_allowed("professional", "free") is True
 
+    def test_is_readme_style_allowed_unknown_style(self):
+        assert PromptOrchestrator.is_readme_style_allowed("nonexistent", "free") is False
+        assert PromptOrchestrator.is_readme_style_allowed("nonexistent", "enterprise") is False
+
 
 class TestProTemplatePrompts:
     @pytest.fixture
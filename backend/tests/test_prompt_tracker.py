@@ -4,7 +4,12 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from services.prompt_tracker import PromptTracker, get_prompt_tracker
+import services.prompt_tracker as tracker_module
+from services.prompt_tracker import (
+    PromptTracker,
+    _serialize_prompt,
+    get_prompt_tracker,
+)
 
 
 @pytest.fixture
@@ -89,6 +94,38 @@ class TestFallbackMode:
         tracker.log_prompt(run_id, "simple prompt text")
         assert "prompt_hash" in tracker._active_runs[run_id]
 
+    def test_log_prompt_same_prompt_same_hash(self, tracker):
+        first = tracker.start_generation_run(
+            template_id="test", model_provider="gemini", archetype="test"
+        )
+        second = tracker.start_generation_run(
+            template_id="test", model_provider="openai", archetype="test"
+        )
+        tracker.log_prompt(first, {"user": "same", "system": "prompt"})
+        tracker.log_prompt(second, {"system": "prompt", "user": "same"})
+
+        assert (
+            tracker._active_runs[first]["prompt_hash"]
+            == (tracker._active_runs[second]["prompt_hash"])
+        )
+        assert len(tracker._active_runs[first]["prompt_hash"]) == 12
+
+    def test_serialize_prompt_matches_without_orjson(self, monkeypatch):
+        pytest.importorskip("orjson")
+        prompt = {"user": 'Café 🚀 "quoted"\nline', "system": "a/b\t<tag>"}
+        with_orjson = _serialize_prompt(prompt)
+
+        monkeypatch.setattr(tracker_module, "orjson", None)
+
+        assert _serialize_prompt(prompt) == with_orjson
+
+    def test_serialize_prompt_accepts_readme_prompt(self):
+        from services.prompt_orchestrator import ReadmePrompt
+
+        prompt = ReadmePrompt("sys", "user")
+
+        assert _serialize_prompt(prompt) == _serialize_prompt({"system": "sys", "user": "user"})
+
     def test_log_prompt_unknown_run_id_is_noop(self, tracker):
         # Should not raise
         tracker.log_prompt("nonexistent-run", {"prompt": "test"})
@@ -141,13 +178,64 @@ class TestFallbackMode:
         assert result is None
 
 
+@pytest.fixture
+def mock_client(mock_mlflow):
+    """The MlflowClient the tracker creates from the mocked module."""
+    return mock_mlflow.tracking.MlflowClient.return_value
+
+
+def _mock_run(mock_client, run_id):
+    mock_run = MagicMock()
+    mock_run.info.run_id = run_id
+    mock_client.create_run.return_value = mock_run
+
+
+class TestActiveRunBounds:
+    def test_stale_runs_are_reaped_on_start(self, tracker):
+        stale = tracker.start_generation_run(
+            template_id="test", model_provider="gemini", archetype="test"
+        )
+        tracker._active_runs[stale]["start_time"] -= tracker_module._RUN_TTL_SECONDS + 1
+
+        fresh = tracker.start_generation_run(
+            template_id="test", model_provider="openai", archetype="test"
+        )
+
+        assert stale not in tracker._active_runs
+        assert fresh in tracker._active_runs
+
+    def test_active_runs_are_capped(self, tracker, monkeypatch):
+        monkeypatch.setattr(tracker_module, "_MAX_ACTIVE_RUNS", 2)
+        run_ids = [
+            tracker.start_generation_run(
+                template_id="test", model_provider=str(i), archetype="test"
+            )
+            for i in range(3)
+        ]
+
+        assert list(tracker._active_runs) == run_ids[1:]
+
+    def test_abandoned_mlflow_run_is_killed(self, tracker_with_mlflow, mock_client):
+        _mock_run(mock_client, "mlflow-run-stale")
+        stale = tracker_with_mlflow.start_generation_run(
+            template_id="test", model_provider="gemini", archetype="test"
+        )
+        tracker_with_mlflow._active_runs[stale]["start_time"] -= tracker_module._RUN_TTL_SECONDS + 1
+
+        _mock_run(mock_client, "mlflow-run-fresh")
+        tracker_with_mlflow.start_generation_run(
+            template_id="test", model_provider="gemini", archetype="test"
+        )
+        assert tracker_with_mlflow.flush()
+
+        mock_client.set_terminated.assert_called_once_with("mlflow-run-stale", status="KILLED")
+
+
 class TestMLflowMode:
     """Tests for operation when MLflow is available (mocked)."""
 
-    def test_start_run_uses_mlflow(self, tracker_with_mlflow, mock_mlflow):
-        mock_run = MagicMock()
-        mock_run.info.run_id = "mlflow-run-123"
-        mock_mlflow.start_run.return_value = mock_run
+    def test_start_run_uses_mlflow(self, tracker_with_mlflow, mock_client):
+        _mock_run(mock_client, "mlflow-run-123")
 
         run_id = tracker_with_mlflow.start_generation_run(
             template_id="portfolio_banner",
@@ -156,10 +244,10 @@ class TestMLflowMode:
         )
 
         assert run_id == "mlflow-run-123"
-        mock_mlflow.start_run.assert_called_once()
+        mock_client.create_run.assert_called_once()
 
-    def test_start_run_mlflow_failure_falls_back(self, tracker_with_mlflow, mock_mlflow):
-        mock_mlflow.start_run.side_effect = Exception("MLflow down")
+    def test_start_run_mlflow_failure_falls_back(self, tracker_with_mlflow, mock_client):
+        mock_client.create_run.side_effect = Exception("MLflow down")
 
         run_id = tracker_with_mlflow.start_generation_run(
             template_id="test",
@@ -170,10 +258,59 @@ class TestMLflowMode:
         assert isinstance(run_id, str)
         assert len(run_id) == 16
 
-    def test_log_result_calls_mlflow(self, tracker_with_mlflow, mock_mlflow):
-        mock_run = MagicMock()
-        mock_run.info.run_id = "mlflow-run-456"
-        mock_mlflow.start_run.return_value = mock_run
+    def test_log_prompt_logs_text_artifact(self, tracker_with_mlflow, mock_mlflow, mock_client):
+        _mock_run(mock_client, "mlflow-run-789")
+
+        run_id = tracker_with_mlflow.start_generation_run(
+            template_id="test",
+            model_provider="gemini",
+            archetype="test",
+        )
+        tracker_with_mlflow.log_prompt(run_id, "prompt text")
+        assert tracker_with_mlflow.flush()
+
+        mock_client.log_text.assert_called_once()
+        logged_run_id, text, artifact_file = mock_client.log_text.call_args.args
+        assert logged_run_id == "mlflow-run-789"
+        assert text == "prompt text"
+        assert artifact_file.startswith("prompts/prompt_")
+        mock_mlflow.log_artifact.assert_not_called()
+
+    def test_writes_are_queued_until_flush(self, tracker_with_mlflow, mock_mlflow, mock_client):
+        _mock_run(mock_client, "mlflow-run-reuse")
+
+        run_id = tracker_with_mlflow.start_generation_run(
+            template_id="test",
+            model_provider="gemini",
+            archetype="test",
+        )
+        tracker_with_mlflow.log_prompt(run_id, "prompt text", prompt_version="v2")
+        tracker_with_mlflow.log_result(run_id, True, 1.0, "gemini-2.0-flash")
+        tracker_with_mlflow.end_run(run_id)
+        assert tracker_with_mlflow.flush()
+
+        mock_mlflow.tracking.MlflowClient.assert_called_once()
+        assert 1 <= mock_client.log_batch.call_count <= 3
+        mock_client.set_terminated.assert_called_once_with(run_id, status="FINISHED")
+
+    def test_worker_start_registers_flush_at_exit(
+        self, tracker_with_mlflow, mock_client, monkeypatch
+    ):
+        _mock_run(mock_client, "mlflow-run-exit")
+        registered = []
+        monkeypatch.setattr(tracker_module.atexit, "register", registered.append)
+
+        run_id = tracker_with_mlflow.start_generation_run(
+            template_id="test", model_provider="gemini", archetype="test"
+        )
+        tracker_with_mlflow.end_run(run_id)
+
+        assert registered == [tracker_with_mlflow.flush]
+        assert registered[0]()
+        mock_client.set_terminated.assert_called_once_with(run_id, status="FINISHED")
+
+    def test_log_result_calls_mlflow(self, tracker_with_mlflow, mock_mlflow, mock_client):
+        _mock_run(mock_client, "mlflow-run-456")
 
         run_id = tracker_with_mlflow.start_generation_run(
             template_id="test",
@@ -186,14 +323,17 @@ class TestMLflowMode:
             latency_seconds=2.0,
             model_used="gemini-2.0-flash",
         )
+        assert tracker_with_mlflow.flush()
 
-        mock_mlflow.log_param.assert_called_with("model_used", "gemini-2.0-flash")
-        mock_mlflow.log_metrics.assert_called_once()
+        mock_client.log_batch.assert_called_once()
+        assert mock_client.log_batch.call_args.args == ("mlflow-run-456",)
+        mock_mlflow.entities.Param.assert_called_once_with("model_used", "gemini-2.0-flash")
+        assert mock_mlflow.entities.Metric.call_count == 3
+        mock_mlflow.log_param.assert_not_called()
+        mock_mlflow.log_metrics.assert_not_called()
 
-    def test_end_run_calls_mlflow(self, tracker_with_mlflow, mock_mlflow):
-        mock_run = MagicMock()
-        mock_run.info.run_id = "mlflow-run-789"
-        mock_mlflow.start_run.return_value = mock_run
+    def test_end_run_calls_mlflow(self, tracker_with_mlflow, mock_mlflow, mock_client):
+        _mock_run(mock_client, "mlflow-run-789")
 
         run_id = tracker_with_mlflow.start_generation_run(
             template_id="test",
@@ -201,16 +341,75 @@ class TestMLflowMode:
             archetype="test",
         )
         tracker_with_mlflow.end_run(run_id, status="FINISHED")
+        assert tracker_with_mlflow.flush()
+
+        mock_client.log_batch.assert_called_once()
+        assert mock_mlflow.entities.Metric.call_args.args[0] == "total_time_seconds"
+        mock_client.set_terminated.assert_called_once_with("mlflow-run-789", status="FINISHED")
+
+    def test_worker_failure_is_logged_not_raised(self, tracker_with_mlflow, mock_client):
+        _mock_run(mock_client, "mlflow-run-err")
+        mock_client.log_batch.side_effect = Exception("MLflow down")
+
+        run_id = tracker_with_mlflow.start_generation_run(
+            template_id="test",
+            model_provider="gemini",
+            archetype="test",
+        )
+        tracker_with_mlflow.end_run(run_id)
+
+        assert tracker_with_mlflow.flush()
+        assert run_id not in tracker_with_mlflow._active_runs
+
+    def test_get_best_prompt_version_queries_mlflow(
+        self, tracker_with_mlflow, mock_mlflow, mock_client
+    ):
+        best = MagicMock()
+        best.data.params = {"prompt_version": "v3"}
+        mock_client.search_runs.return_value = [best]
+
+        result = tracker_with_mlflow.get_best_prompt_version("neon_circuit", "gemini")
+        tracker_with_mlflow.get_best_prompt_version("skill_wheel", "gemini")
+
+        assert result == "v3"
+        mock_mlflow.tracking.MlflowClient.assert_called_once()
+        assert mock_client.search_runs.call_args.kwargs["experiment_ids"] == ["exp-1"]
+
+    def test_get_best_prompt_version_is_cached(self, tracker_with_mlflow, mock_client):
+        best = MagicMock()
+        best.data.params = {"prompt_version": "v3"}
+        mock_client.search_runs.return_value = [best]
+
+        first = tracker_with_mlflow.get_best_prompt_version("neon_circuit", "gemini")
+        second = tracker_with_mlflow.get_best_prompt_version("neon_circuit", "gemini")
+
+        assert first == second == "v3"
+        mock_client.search_runs.assert_called_once()
+
+    def test_get_best_prompt_version_cache_expires(self, tracker_with_mlflow, mock_client):
+        mock_client.search_runs.return_value = []
+        tracker_with_mlflow.get_best_prompt_version("neon_circuit", "gemini")
+        for key, (_, version) in list(tracker_with_mlflow._best_versions.items()):
+            tracker_with_mlflow._best_versions[key] = (0.0, version)
+
+        tracker_with_mlflow.get_best_prompt_version("neon_circuit", "gemini")
+
+        assert mock_client.search_runs.call_count == 2
+
+    def test_get_best_prompt_version_failure_not_cached(self, tracker_with_mlflow, mock_client):
+        mock_client.search_runs.side_effect = Exception("MLflow down")
+
+        assert tracker_with_mlflow.get_best_prompt_version("neon_circuit", "gemini") is None
+        assert tracker_with_mlflow.get_best_prompt_version("neon_circuit", "gemini") is None
+        assert mock_client.search_runs.call_count == 2
 
-        mock_mlflow.log_metric.assert_called_once()
-        mock_mlflow.end_run.assert_called_once_with(status="FINISHED")
+    def test_flush_without_writes_returns_immediately(self, tracker_with_mlflow):
+        assert tracker_with_mlflow.flush(timeout=0) is True
 
 
 class TestCustomTags:
-    def test_tags_passed_to_mlflow(self, tracker_with_mlflow, mock_mlflow):
-        mock_run = MagicMock()
-        mock_run.info.run_id = "run-tags"
-        mock_mlflow.start_run.return_value = mock_run
+    def test_tags_passed_to_mlflow(self, tracker_with_mlflow, mock_client):
+        _mock_run(mock_client, "run-tags")
 
         tracker_with_mlflow.start_generation_run(
             template_id="neon_circuit",
@@ -220,8 +419,7 @@ class TestCustomTags:
             tags={"custom_tag": "value"},
         )
 
-        call_kwargs = mock_mlflow.start_run.call_args
-        tags = call_kwargs[1]["tags"] if "tags" in call_kwargs[1] else call_kwargs.kwargs["tags"]
+        tags = mock_client.create_run.call_args.kwargs["tags"]
         assert tags["custom_tag"] == "value"
         assert tags["tier"] == "pro"
 
@@ -1,6 +1,19 @@
 """Tests for the scoring engine."""
 
-from services.scoring_engine import ScoringEngine
+from unittest.mock import patch
+
+import pytest
+
+from services import scoring_engine
+from services.scoring_engine import (
+    _AI_NAME_RE,
+    AI_COMMIT_PATTERNS,
+    AI_COMMIT_SIGNAL_NAMES,
+    ScoringEngine,
+    _count_matching,
+    _profile_aggregates,
+    ai_commit_signals,
+)
 
 
 class TestScoringEngine:
@@ -315,6 +328,13 @@ class TestScoringEngine:
         assert "top_repos" in tech
         assert "react" in tech["frameworks"]
 
+    def test_top_repos_by_stars_keeps_input_order_on_ties(self):
+        """Top repos are the five most-starred, ties in input order."""
+        stars = [3, 9, 1, 9, 5, 7, 3, 0]
+        repos = [{"name": f"r{i}", "stars": n} for i, n in enumerate(stars)]
+        tech = self.engine._build_tech_profile(self._make_profile(repos=repos))
+        assert [r["name"] for r in tech["top_repos"]] == ["r1", "r3", "r5", "r4", "r0"]
+
     def test_score_profile_with_no_commits(self):
         """Score profile works correctly without commit data."""
         profile = self._make_profile()
@@ -354,3 +374,218 @@ class TestScoringEngine:
         profile = self._make_profile()
         result = self.engine.score_profile(profile)
         assert result["archetype"]["id"] is not None
+
+    def test_ai_tools_detected_from_topics(self):
+        """Tool keywords match anywhere in a topic, including overlapping ones."""
+        profile = self._make_profile(
+            repos=[
+                {"name": "a", "topics": ["GitHub-Copilot", "openaider"]},
+                {"name": "b", "topics": ["bard-bot", "cursor-rules"]},
+                {"name": "c", "topics": ["claude"]},
+            ],
+        )
+        ai = self.engine._analyze_ai_usage(profile)
+        assert ai["detected_tools"] == [
+            "Aider",
+            "ChatGPT/OpenAI",
+            "Claude",
+            "Cursor",
+            "GitHub Copilot",
+            "Google Gemini",
+        ]
+
+    def test_ai_tools_do_not_match_across_topics(self):
+        """Keywords are not formed by joining adjacent topics."""
+        profile = self._make_profile(repos=[{"name": "a", "topics": ["clau", "de"]}])
+        assert self.engine._analyze_ai_usage(profile)["detected_tools"] == []
+
+    def test_profile_aggregates(self):
+        """Aggregates collect topics, languages and repo totals in one pass."""
+        profile = self._make_profile(
+            repos=[
+                {"name": "llm-chat", "stars": 5, "forks": 1, "topics": ["AI", "react"]},
+                {"name": "site", "stars": 2, "topics": ["react"]},
+            ],
+            languages=[{"name": "Python"}, {"name": "TypeScript"}],
+        )
+        agg = _profile_aggregates(profile)
+        assert agg.all_topics == {"ai", "react"}
+        assert agg.lang_names == {"Python", "TypeScript"}
+        assert agg.total_stars == 7
+        assert agg.total_forks == 1
+        assert agg.ai_repo_count == 1
+        assert agg.ai_config_count == 0
+        assert agg.updated_ats == (None, None)
+        assert agg.topic_text == "ai\nreact\nreact"
+        assert [r["name"] for r in agg.top_repos] == ["llm-chat", "site"]
+
+    def test_count_matching_counts_each_text_once(self):
+        """Batched scan counts matching texts, not individual matches."""
+        texts = ["gpt-llm-agent", "website", "", "notes\nabout nlp", "blog", "ml"]
+        assert _count_matching(_AI_NAME_RE, texts) == sum(1 for t in texts if _AI_NAME_RE.search(t))
+        assert _count_matching(_AI_NAME_RE, []) == 0
+
+    def test_ai_name_match_is_case_insensitive(self):
+        """Repo names/descriptions are lowercased before the lowercase-only scan."""
+        repos = [
+            {"name": "GPT-Tool"},
+            {"name": "site", "description": "Built on BERT"},
+            {"name": "Notes", "description": "Personal CV"},
+        ]
+        agg = _profile_aggregates(self._make_profile(repos=repos))
+        assert agg.ai_repo_count == 2
+
+    def test_profile_aggregates_config_count(self):
+        """AI config hints count once per repo, from name, description or topics."""
+        repos = [
+            {"name": "dotfiles", "description": "My .cursorrules and .aider setup", "topics": []},
+            {"name": "app", "topics": ["Windsurf"]},
+            {"name": "copilot-instructions"},
+            {"name": "plain", "description": None},
+        ]
+        agg = _profile_aggregates(self._make_profile(repos=repos))
+        assert agg.ai_config_count == 3
+
+    def test_scorers_match_with_and_without_aggregates(self):
+        """Passing precomputed aggregates does not change any score."""
+        profile = self._make_profile(
+            repos=[
+                {"name": "gpt-tool", "stars": 40, "forks": 3, "topics": ["llm", "fastapi"]},
+                {"name": "web", "stars": 1, "topics": ["react", "docker"]},
+            ],
+            languages={"Python": 3, "TypeScript": 1},
+        )
+        agg = _profile_aggregates(profile)
+        for scorer in (
+            self.engine._score_activity,
+            self.engine._score_collaboration,
+            self.engine._score_stack_diversity,
+            self.engine._build_tech_profile,
+        ):
+            assert scorer(profile, agg) == scorer(profile)
+        assert self.engine._score_ai_savviness(
+            profile, None, agg
+        ) == self.engine._score_ai_savviness(profile)
+
+    def test_score_profile_scores_ai_savviness_once(self):
+        """The AI analysis reuses the savviness score instead of recomputing it."""
+        scoring_engine._result_cache.clear()
+        profile = self._make_profile(followers=987)
+        with patch.object(
+            ScoringEngine, "_score_ai_savviness", autospec=True, return_value=42
+        ) as scorer:
+            result = self.engine.score_profile(profile)
+        scorer.assert_called_once()
+        assert result["ai_analysis"]["ai_score"] == 42
+        assert result["ai_analysis"]["overall_bucket"] == "30_60"
+
+
+class TestScoreResultCache:
+    """score_profile reuses results for identical inputs within the TTL."""
+
+    def setup_method(self):
+        scoring_engine._result_cache.clear()
+        self.engine = ScoringEngine()
+        self.profile = TestScoringEngine()._make_profile(
+            repos=[{"name": "api", "stars": 3, "topics": ["fastapi"]}]
+        )
+
+    def teardown_method(self):
+        scoring_engine._result_cache.clear()
+
+    def test_identical_inputs_hit_cache(self):
+        first = self.engine.score_profile(self.profile)
+        with patch.object(ScoringEngine, "_score_uncached") as uncached:
+            second = ScoringEngine().score_profile(dict(self.profile))
+        uncached.assert_not_called()
+        assert second == first
+
+    def test_cached_result_is_a_copy(self):
+        first = self.engine.score_profile(self.profile)
+        first["scores"]["activity"] = -1
+        assert self.engine.score_profile(self.profile)["scores"]["activity"] != -1
+
+    def test_commit_data_is_part_of_key(self):
+        self.engine.score_profile(self.profile)
+        result = self.engine.score_profile(self.profile, [{"message": "use copilot"}])
+        assert "commit_analysis" in result["ai_analysis"]
+
+    def test_expired_entry_is_rescored(self):
+        self.engine.score_profile(self.profile)
+        with (
+            patch.object(scoring_engine.time, "monotonic", return_value=1e12),
+            patch.object(
+                ScoringEngine, "_score_uncached", return_value={"archetype": {"id": "x"}}
+            ) as uncached,
+        ):
+            self.engine.score_profile(self.profile)
+        uncached.assert_called_once()
+
+    def test_cache_is_bounded(self):
+        with patch.object(scoring_engine, "_RESULT_CACHE_SIZE", 2):
+            for followers in range(4):
+                self.engine.score_profile({**self.profile, "followers": followers})
+        assert len(scoring_engine._result_cache) == 2
+
+
+class TestAICommitSignals:
+    """ai_commit_signals matches the AI_COMMIT_PATTERNS in one AI_COMMIT_RE scan."""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Co-authored-by: copilot[bot] <bot@github.com>",
+            "Co-authored-by: Copilot <c@x>\nCo-authored-by: renovate[bot] <r@x>",
+            "feat: chatgpt-4 via gpt-4 and codeium, cody too",
+            "AI-generated, ai assisted, claude by anthropic on bard",
+            "co-authored-by: [bot]\ncopilot",
+            "Co-authored-by: Jane\n[bot] tag",
+            "docs: update README",
+        ],
+    )
+    def test_matches_independent_patterns(self, message):
+        expected = {
+            name
+            for name, pattern in zip(AI_COMMIT_SIGNAL_NAMES, AI_COMMIT_PATTERNS, strict=True)
+            if pattern.search(message)
+        }
+        assert ai_commit_signals(message) == expected
+
+    def test_tool_mentions(self):
+        assert ai_commit_signals("Used ChatGPT, then Claude; AI-assisted refactor") == {
+            "gpt",
+            "claude",
+            "assisted",
+        }
+
+    def test_overlapping_signals_all_reported(self):
+        message = "fix: login\n\nCo-authored-by: GitHub Copilot <copilot@github.com>"
+        assert ai_commit_signals(message) == {"copilot_ca", "copilot"}
+
+    def test_copilot_bot_trailer_reports_both(self):
+        assert ai_commit_signals("Co-authored-by: copilot[bot] <bot@github.com>") == {
+            "copilot_ca",
+            "bot",
+            "copilot",
+        }
+
+    def test_scoring_reports_signal_counts(self):
+        commits = [
+            {"message": "Used ChatGPT", "committed_date": "2026-01-01T00:00:00Z"},
+            {"message": "fix\n\nCo-authored-by: renovate[bot] <r@x>"},
+            {"message": "chatgpt again"},
+        ]
+        result = ScoringEngine().score_profile({"repos": []}, commits)
+        assert result["ai_analysis"]["commit_analysis"]["ai_commit_signals"] == {
+            "bot": 1,
+            "gpt": 2,
+        }
+
+    def test_bot_trailer(self):
+        assert ai_commit_signals("Co-authored-by: renovate[bot] <bot@renovate>") == {"bot"}
+
+    def test_co_author_does_not_span_lines(self):
+        assert ai_commit_signals("Co-authored-by: Jane\n[bot] tag") == set()
+
+    def test_no_signals(self):
+        assert ai_commit_signals("docs: update README") == set()
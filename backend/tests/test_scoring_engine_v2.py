@@ -8,10 +8,13 @@ burst score integration, and all archetype requirement paths.
 from datetime import UTC, datetime, timedelta
 
 from services.scoring_engine import (
+    _ARCHETYPE_TABLE,
     ARCHETYPES,
     KNOWN_FRAMEWORKS,
     ScoringEngine,
+    _freshness_sum,
     _log_scale,
+    _requirement_bits,
     _time_decay_weight,
 )
 
@@ -77,6 +80,20 @@ class TestTimeDecay:
         weight = _time_decay_weight(half_date, half_life_days=180)
         assert abs(weight - 0.5) < 0.05
 
+    def test_explicit_now_ts(self):
+        now_ts = datetime(2026, 1, 31, 12, tzinfo=UTC).timestamp()
+        assert _time_decay_weight("2026-01-31T00:00:00Z", now_ts=now_ts) == 1.0
+        # Whole elapsed days only, matching timedelta.days
+        assert _time_decay_weight("2026-01-30T13:00:00", now_ts=now_ts) == 1.0
+        half = _time_decay_weight("2025-08-04", half_life_days=180, now_ts=now_ts)
+        assert abs(half - 0.5) < 0.01
+
+    def test_freshness_sum(self):
+        recent = (datetime.now(UTC) - timedelta(days=1)).strftime("%Y-%m-%d")
+        total = _freshness_sum([recent, None, "not-a-date", recent])
+        assert abs(total - 2 * _time_decay_weight(recent)) < 1e-9
+        assert _freshness_sum([]) == 0
+
 
 class TestScoringEngineV2:
     """V2-specific scoring engine tests."""
@@ -744,6 +761,19 @@ class TestScoringEngineV2:
         # for high AI + activity + low collab profile
         assert result["id"] == "ai_indie_hacker"
 
+    def test_archetype_table_matches_archetypes(self):
+        """Precomputed table mirrors ARCHETYPES, with weights split by sign."""
+        assert [spec.id for spec in _ARCHETYPE_TABLE] == list(ARCHETYPES)
+        for spec in _ARCHETYPE_TABLE:
+            archetype = ARCHETYPES[spec.id]
+            assert (spec.name, spec.description, spec.min_score) == (
+                archetype["name"],
+                archetype["description"],
+                archetype["min_score"],
+            )
+            assert dict(spec.positive + spec.negative) == archetype["weights"]
+            assert spec.positive_sum == sum(w for w in archetype["weights"].values() if w > 0)
+
     def test_all_archetypes_defined_correctly(self):
         """Verify all archetypes have required fields."""
         required_keys = {"name", "description", "weights", "min_score"}
@@ -761,3 +791,20 @@ class TestScoringEngineV2:
         assert "fastapi" in KNOWN_FRAMEWORKS
         assert "docker" in KNOWN_FRAMEWORKS
         assert "pytorch" in KNOWN_FRAMEWORKS
+
+    def test_known_frameworks_is_frozen(self):
+        """Lookup sets are immutable so they can be shared safely."""
+        assert isinstance(KNOWN_FRAMEWORKS, frozenset)
+
+    def test_requirement_masks_cover_archetype_requires(self):
+        """Every archetype requirement flag maps to a bit in its mask."""
+        for spec in _ARCHETYPE_TABLE:
+            archetype = ARCHETYPES[spec.id]
+            required = spec.req_mask
+            satisfied = _requirement_bits(
+                frozenset({"Python", "TypeScript"}), frozenset({"docker", "security"})
+            )
+            assert satisfied & required == required
+            if archetype.get("requires"):
+                assert required
+                assert _requirement_bits(frozenset(), frozenset()) & required != required
@@ -0,0 +1,86 @@
+"""Tests for the skill registry."""
+
+from datetime import datetime
+
+import pytest
+
+from skills.base import SkillBase, SkillContext, SkillMetadata, SkillResult, SkillStatus
+from skills.registry import SkillRegistry
+
+
+def _make_skill(name: str, version: str = "1.0.0", tags: list[str] | None = None) -> SkillBase:
+    class _Skill(SkillBase):
+        metadata = SkillMetadata(
+            name=name,
+            version=version,
+            description=f"{name} skill",
+            tags=tags or [],
+        )
+
+        async def execute(self, context: SkillContext) -> SkillResult:
+            return SkillResult.success({"skill": name})
+
+    return _Skill()
+
+
+class TestListSkills:
+    def test_lists_metadata(self):
+        registry = SkillRegistry()
+        registry.register(_make_skill("scoring", tags=["core"]))
+
+        (entry,) = registry.list_skills()
+        assert entry["name"] == "scoring"
+        assert entry["version"] == "1.0.0"
+        assert entry["author"] == "LEEI1337"
+        assert entry["tags"] == ("core",)
+
+    def test_cached_until_register(self):
+        registry = SkillRegistry()
+        registry.register(_make_skill("a"))
+        first = registry.list_skills()
+        assert registry.list_skills() is first
+
+        registry.register(_make_skill("b"))
+        assert [s["name"] for s in registry.list_skills()] == ["a", "b"]
+
+    def test_entries_read_only(self):
+        registry = SkillRegistry()
+        registry.register(_make_skill("a"))
+        with pytest.raises(TypeError):
+            registry.list_skills()[0]["name"] = "changed"
+
+
+class TestListSkillSummaries:
+    def test_name_and_version_only(self):
+        registry = SkillRegistry()
+        registry.register(_make_skill("a", version="2.1.0"))
+        registry.register(_make_skill("b"))
+        assert registry.list_skill_summaries() == (("a", "2.1.0"), ("b", "1.0.0"))
+
+    def test_cached_until_register(self):
+        registry = SkillRegistry()
+        registry.register(_make_skill("a"))
+        first = registry.list_skill_summaries()
+        assert registry.list_skill_summaries() is first
+
+        registry.register(_make_skill("a", version="1.1.0"))
+        assert registry.list_skill_summaries() == (("a", "1.1.0"),)
+
+
+class TestExecute:
+    @pytest.mark.asyncio
+    async def test_execute_success(self):
+        registry = SkillRegistry()
+        registry.register(_make_skill("a"))
+        result = await registry.execute("a", SkillContext(session_id="s1"))
+        assert result.is_success
+        assert result.data == {"skill": "a"}
+        stamped = datetime.fromisoformat(result.timestamp)
+        assert stamped.utcoffset().total_seconds() == 0
+        assert stamped.microsecond == 0
+
+    @pytest.mark.asyncio
+    async def test_execute_unknown(self):
+        result = await SkillRegistry().execute("missing", SkillContext(session_id="s1"))
+        assert result.status == SkillStatus.FAILED
+        assert result.errors == ["Skill not found: missing"]
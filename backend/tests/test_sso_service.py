@@ -1,9 +1,14 @@
 """Tests for SSO/SAML Authentication Service."""
 
+import hashlib
+import json
+from urllib.parse import parse_qs, urlsplit
+
 import fakeredis.aioredis
 import pytest
 from pydantic import ValidationError
 
+from services import sso_service
 from services.sso_service import (
     SSOConfig,
     SSOError,
@@ -13,6 +18,10 @@ from services.sso_service import (
 )
 
 
+def _issued_nonce(init: dict[str, str]) -> str:
+    return parse_qs(urlsplit(init["redirect_url"]).query)["nonce"][0]
+
+
 @pytest.fixture
 async def fake_redis():
     server = fakeredis.FakeServer()
@@ -181,6 +190,14 @@ class TestSSOFlow:
         assert "github.com/login/oauth/authorize" in result["redirect_url"]
         assert "client_id=gh-client-id" in result["redirect_url"]
 
+    @pytest.mark.asyncio
+    async def test_initiate_stores_org_id_and_nonce(self, service, fake_redis, oidc_config):
+        await service.save_sso_config(oidc_config)
+        result = await service.initiate_sso("oidc-org")
+        stored = json.loads(await fake_redis.get(f"sso:nonce:{result['state']}"))
+        assert stored == {"org_id": "oidc-org", "nonce": _issued_nonce(result)}
+        assert await fake_redis.ttl(f"sso:nonce:{result['state']}") > 0
+
     @pytest.mark.asyncio
     async def test_initiate_unconfigured_raises(self, service):
         with pytest.raises(SSOError, match="not configured"):
@@ -201,9 +218,46 @@ class TestSSOFlow:
         assert session.org_id == "acme"
         assert session.provider == SSOProvider.SAML
         assert session.role == "member"
-        assert session.user_hash != ""
+        assert session.user_hash == hashlib.blake2b(b"user-123", digest_size=16).hexdigest()
         assert session.session_id != ""
 
+    @pytest.mark.asyncio
+    async def test_verify_callback_oidc_checks_nonce(self, service, oidc_config):
+        await service.save_sso_config(oidc_config)
+        init = await service.initiate_sso("oidc-org")
+
+        session = await service.verify_callback(
+            state=init["state"],
+            assertion_data={
+                "sub": "user-123",
+                "email": "user@example.com",
+                "nonce": _issued_nonce(init),
+            },
+        )
+        assert session.provider == SSOProvider.OIDC
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("claim", [{}, {"nonce": "replayed"}])
+    async def test_verify_callback_oidc_rejects_bad_nonce(self, service, oidc_config, claim):
+        await service.save_sso_config(oidc_config)
+        init = await service.initiate_sso("oidc-org")
+
+        with pytest.raises(SSOError, match="Invalid SSO nonce"):
+            await service.verify_callback(
+                state=init["state"],
+                assertion_data={"sub": "user-123", "email": "user@example.com", **claim},
+            )
+
+    @pytest.mark.asyncio
+    async def test_verify_callback_state_is_single_use(self, service, sample_sso_config):
+        await service.save_sso_config(sample_sso_config)
+        init = await service.initiate_sso("acme")
+        assertion = {"subject": "user-123", "email": "user@acme.com"}
+
+        await service.verify_callback(state=init["state"], assertion_data=assertion)
+        with pytest.raises(SSOError, match="Invalid or expired"):
+            await service.verify_callback(state=init["state"], assertion_data=assertion)
+
     @pytest.mark.asyncio
     async def test_verify_callback_invalid_state(self, service):
         with pytest.raises(SSOError, match="Invalid or expired"):
@@ -334,6 +388,92 @@ class TestSSOSessions:
         assert await service.validate_session(s1.session_id) is None
         assert await service.validate_session(s2.session_id) is None
 
+    @pytest.mark.asyncio
+    async def test_revoke_all_sessions_only_touches_org(
+        self, service, sample_sso_config, fake_redis
+    ):
+        await service.save_sso_config(sample_sso_config)
+        await service.save_sso_config(sample_sso_config.model_copy(update={"org_id": "other"}))
+
+        init = await service.initiate_sso("acme")
+        mine = await service.verify_callback(
+            state=init["state"], assertion_data={"subject": "a", "email": "a@acme.com"}
+        )
+        init = await service.initiate_sso("other")
+        theirs = await service.verify_callback(
+            state=init["state"], assertion_data={"subject": "b", "email": "b@acme.com"}
+        )
+
+        assert await service.revoke_all_sessions("acme") == 1
+        assert await service.validate_session(mine.session_id) is None
+        assert await service.validate_session(theirs.session_id) is not None
+        assert await fake_redis.exists("sso:org_sessions:acme") == 0
+        assert await service.revoke_all_sessions("acme") == 0
+
+    @pytest.mark.asyncio
+    async def test_revoke_all_keeps_racing_login_indexed(
+        self, service, sample_sso_config, fake_redis
+    ):
+        await service.save_sso_config(sample_sso_config)
+        init = await service.initiate_sso("acme")
+        await service.verify_callback(
+            state=init["state"], assertion_data={"subject": "a", "email": "a@acme.com"}
+        )
+
+        real_zrange = fake_redis.zrange
+
+        async def zrange_then_login(*args, **kwargs):
+            snapshot = await real_zrange(*args, **kwargs)
+            # A login lands between the index read and the delete
+            await fake_redis.zadd("sso:org_sessions:acme", {"late": 2**40})
+            return snapshot
+
+        fake_redis.zrange = zrange_then_login
+        assert await service.revoke_all_sessions("acme") == 1
+        assert await real_zrange("sso:org_sessions:acme", 0, -1) == [b"late"]
+
+    @pytest.mark.asyncio
+    async def test_revoke_all_covers_unindexed_legacy_sessions(
+        self, service, sample_sso_config, fake_redis
+    ):
+        await service.save_sso_config(sample_sso_config)
+        legacy = SSOSession(org_id="acme", provider=SSOProvider.SAML, user_hash="h")
+        await fake_redis.setex(f"sso:session:{legacy.session_id}", 60, legacy.model_dump_json())
+        other = SSOSession(org_id="other", provider=SSOProvider.SAML, user_hash="h")
+        await fake_redis.setex(f"sso:session:{other.session_id}", 60, other.model_dump_json())
+
+        assert await service.revoke_all_sessions("acme") == 1
+        assert await service.validate_session(legacy.session_id) is None
+        assert await service.validate_session(other.session_id) is not None
+        assert await fake_redis.zcard("sso:org_sessions:other") == 1
+
+    @pytest.mark.asyncio
+    async def test_session_index_backfill_runs_once(self, service, fake_redis, monkeypatch):
+        monkeypatch.setattr(sso_service, "_BACKFILL_BATCH", 2)
+        for _ in range(3):
+            legacy = SSOSession(org_id="acme", provider=SSOProvider.SAML, user_hash="h")
+            await fake_redis.setex(f"sso:session:{legacy.session_id}", 60, legacy.model_dump_json())
+        assert await service.revoke_all_sessions("acme") == 3
+
+        # Later revokes read only the index, never the keyspace
+        late = SSOSession(org_id="acme", provider=SSOProvider.SAML, user_hash="h")
+        await fake_redis.setex(f"sso:session:{late.session_id}", 60, late.model_dump_json())
+        assert await service.revoke_all_sessions("acme") == 0
+
+    @pytest.mark.asyncio
+    async def test_revoke_session_removes_from_org_index(
+        self, service, sample_sso_config, fake_redis
+    ):
+        await service.save_sso_config(sample_sso_config)
+        init = await service.initiate_sso("acme")
+        session = await service.verify_callback(
+            state=init["state"], assertion_data={"subject": "a", "email": "a@acme.com"}
+        )
+        assert await fake_redis.zcard("sso:org_sessions:acme") == 1
+
+        assert await service.revoke_session(session.session_id) is True
+        assert await fake_redis.zcard("sso:org_sessions:acme") == 0
+
 
 # --- Identity Extraction ---
 
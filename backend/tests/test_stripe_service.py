@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
+from services import stripe_service as stripe_service_module
 from services.stripe_service import (
     TIER_PRODUCTS,
     PaymentError,
@@ -62,6 +63,13 @@ class TestTierProducts:
         yearly_per_month = pro["price_yearly_cents"] / 12
         assert yearly_per_month < pro["price_monthly_cents"]
 
+    def test_products_read_only(self):
+        with pytest.raises(TypeError):
+            TIER_PRODUCTS[UserTier.FREE] = {}
+        with pytest.raises(TypeError):
+            TIER_PRODUCTS[UserTier.PRO]["price_monthly_cents"] = 1
+        assert isinstance(TIER_PRODUCTS[UserTier.PRO]["features"], tuple)
+
 
 class TestStripeServiceInit:
     def test_enabled_with_key(self, stripe_service):
@@ -138,6 +146,13 @@ class TestCheckoutSession:
 
         assert result["billing_period"] == "yearly"
         assert result["amount_cents"] == TIER_PRODUCTS[UserTier.PRO]["price_yearly_cents"]
+        form_data = mock_client.post.call_args.kwargs["data"]
+        assert form_data["line_items[0][price_data][recurring][interval]"] == "year"
+        assert form_data["line_items[0][price_data][unit_amount]"] == str(
+            TIER_PRODUCTS[UserTier.PRO]["price_yearly_cents"]
+        )
+        assert form_data["metadata[gps_session_id]"] == "sess-test"
+        assert form_data["metadata[gps_tier]"] == "pro"
 
     @pytest.mark.asyncio
     async def test_checkout_stripe_error(self, stripe_service):
@@ -200,6 +215,67 @@ class TestPortalSession:
         assert "stripe.com" in result["portal_url"]
 
 
+class TestHttpClient:
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self, stripe_service):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "url": "https://billing.stripe.com/p/session/test_portal",
+        }
+
+        with patch("httpx.AsyncClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_response
+            mock_client_cls.return_value = mock_client
+
+            await stripe_service.create_portal_session("cus_1")
+            await stripe_service.create_portal_session("cus_2")
+
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.call_args.kwargs["base_url"] == StripeService.STRIPE_API_BASE
+        assert mock_client_cls.call_args.kwargs["http2"] is stripe_service_module._HTTP2
+        assert mock_client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_client(self, stripe_service):
+        with patch("httpx.AsyncClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client_cls.return_value = mock_client
+            stripe_service._get_client()
+
+            await stripe_service.aclose()
+
+        mock_client.aclose.assert_awaited_once()
+        assert stripe_service._client is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_without_client(self, stripe_service):
+        await stripe_service.aclose()
+        assert stripe_service._client is None
+
+
+class TestSharedService:
+    @pytest.mark.asyncio
+    async def test_lifecycle(self):
+        from app import dependencies
+
+        dependencies.init_stripe()
+        service = dependencies.get_stripe_service()
+        assert dependencies.get_stripe_service() is service
+
+        with patch("httpx.AsyncClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client_cls.return_value = mock_client
+            service._get_client()
+
+            await dependencies.close_stripe()
+
+        mock_client.aclose.assert_awaited_once()
+        with pytest.raises(RuntimeError, match="not initialized"):
+            dependencies.get_stripe_service()
+
+
 class TestWebhookVerification:
     def _sign_payload(self, payload: bytes, secret: str) -> str:
         """Helper to create a valid Stripe webhook signature."""
@@ -222,6 +298,15 @@ class TestWebhookVerification:
         event = await stripe_service.verify_webhook_signature(payload, signature, secret)
         assert event["type"] == "checkout.session.completed"
 
+    @pytest.mark.asyncio
+    async def test_spaced_signature_header(self, stripe_service):
+        payload = b'{"type": "test"}'
+        secret = "whsec_test"  # noqa: S105
+        signature = self._sign_payload(payload, secret).replace(",", ", ")
+
+        event = await stripe_service.verify_webhook_signature(payload, f" {signature} ", secret)
+        assert event["type"] == "test"
+
     @pytest.mark.asyncio
     async def test_invalid_signature_raises(self, stripe_service):
         payload = b'{"type": "test"}'
@@ -231,6 +316,15 @@ class TestWebhookVerification:
                 payload, f"t={ts},v1=badsig", "whsec_test"
             )
 
+    @pytest.mark.asyncio
+    async def test_wrong_hex_signature(self, stripe_service):
+        payload = b'{"type": "test"}'
+        ts = str(int(time.time()))
+        with pytest.raises(PaymentError, match="verification failed"):
+            await stripe_service.verify_webhook_signature(
+                payload, f"t={ts},v1={'0' * 64}", "whsec_test"
+            )
+
     @pytest.mark.asyncio
     async def test_missing_signature_parts(self, stripe_service):
         with pytest.raises(PaymentError, match="format"):
@@ -249,6 +343,21 @@ class TestWebhookVerification:
         with pytest.raises(PaymentError, match="too old"):
             await stripe_service.verify_webhook_signature(payload, header, "whsec_test")
 
+    @pytest.mark.asyncio
+    async def test_repeated_verification_same_secret(self, stripe_service):
+        for event_type in ("first", "second", "third"):
+            payload = json.dumps({"type": event_type}).encode()
+            header = self._sign_payload(payload, "whsec_test")
+            event = await stripe_service.verify_webhook_signature(payload, header, "whsec_test")
+            assert event["type"] == event_type
+
+    @pytest.mark.asyncio
+    async def test_extra_signature_fields_ignored(self, stripe_service):
+        payload = b'{"type": "test"}'
+        header = self._sign_payload(payload, "whsec_test") + ",v0=legacy,flag"
+        event = await stripe_service.verify_webhook_signature(payload, header, "whsec_test")
+        assert event["type"] == "test"
+
 
 class TestEventParsing:
     def test_get_tier_from_event(self, stripe_service):
@@ -299,3 +408,12 @@ class TestGetTierFeatures:
         free = get_tier_features(UserTier.FREE)
         pro = get_tier_features(UserTier.PRO)
         assert pro["rate_limit_generate_per_day"] > free["rate_limit_generate_per_day"]
+
+    def test_features_cached_per_tier(self):
+        assert get_tier_features(UserTier.PRO) is get_tier_features(UserTier.PRO)
+
+    def test_features_read_only(self):
+        features = get_tier_features(UserTier.FREE)
+        with pytest.raises(TypeError):
+            features["templates"] = 99
+        assert get_tier_features(UserTier.FREE)["templates"] == 3
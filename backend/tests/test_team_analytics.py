@@ -1,8 +1,12 @@
 """Tests for Team/Org Analytics Dashboard Service."""
 
+from datetime import datetime
+from unittest.mock import patch
+
 import fakeredis.aioredis
 import pytest
 
+from app.clock import utc_now_iso
 from services.team_analytics import (
     AggregationPeriod,
     TeamAnalyticsService,
@@ -58,6 +62,20 @@ class TestTeamMemberSummary:
         assert m.archetype == "code_explorer"
         assert m.analyzed_at != ""
 
+    def test_analyzed_at_is_utc_iso(self):
+        m = TeamMemberSummary(member_hash="abc")
+        parsed = datetime.fromisoformat(m.analyzed_at)
+        assert parsed.utcoffset().total_seconds() == 0
+        assert parsed.microsecond == 0
+
+    def test_utc_now_iso_reused_within_a_second(self):
+        with patch("app.clock.time.time", return_value=1_700_000_000.2):
+            first = utc_now_iso()
+        with patch("app.clock.time.time", return_value=1_700_000_000.9):
+            assert utc_now_iso() is first
+        with patch("app.clock.time.time", return_value=1_700_000_001.0):
+            assert utc_now_iso() == "2023-11-14T22:13:21+00:00"
+
     def test_defaults(self):
         m = TeamMemberSummary(member_hash="abc")
         assert m.archetype == "code_explorer"
@@ -97,6 +115,13 @@ class TestTeamAnalyticsService:
         result = await service.add_member_analysis("acme", member)
         assert result == "hash1"
 
+    @pytest.mark.asyncio
+    async def test_add_member_sets_ttls(self, service, fake_redis):
+        await service.add_member_analysis("acme", _make_member("hash1"))
+        assert await fake_redis.sismember("team:acme:members", "hash1")
+        assert 0 < await fake_redis.ttl("team:acme:members") <= 1800
+        assert 0 < await fake_redis.ttl("team_member:acme:hash1") <= 1800
+
     @pytest.mark.asyncio
     async def test_dashboard_empty_org(self, service):
         dashboard = await service.get_dashboard("empty-org")
@@ -219,6 +244,25 @@ class TestTeamAnalyticsService:
         dashboard = await service.get_dashboard("org6")
         assert dashboard.team_size == 0
 
+    @pytest.mark.asyncio
+    async def test_scores_average_over_reporting_members(self, service):
+        await service.add_member_analysis("org8", _make_member("h1", activity=90))
+        partial = TeamMemberSummary(member_hash="h2", scores={"activity": 30.0})
+        await service.add_member_analysis("org8", partial)
+
+        dashboard = await service.get_dashboard("org8")
+        assert dashboard.aggregate_scores["activity"] == 60.0
+        assert dashboard.aggregate_scores["stack_diversity"] == 50.0
+
+    @pytest.mark.asyncio
+    async def test_expired_member_skipped(self, service, fake_redis):
+        await service.add_member_analysis("org7", _make_member("live"))
+        await service.add_member_analysis("org7", _make_member("gone"))
+        await fake_redis.delete("team_member:org7:gone")
+
+        dashboard = await service.get_dashboard("org7")
+        assert dashboard.team_size == 1
+
     @pytest.mark.asyncio
     async def test_clear_empty_team(self, service):
         deleted = await service.clear_team("nonexistent")
@@ -1,9 +1,12 @@
 """Tests for White-Label Configuration Service."""
 
+import time
+
 import fakeredis.aioredis
 import pytest
 from pydantic import ValidationError
 
+from app.dependencies import get_whitelabel_service
 from services.whitelabel import (
     BrandTheme,
     WhiteLabelConfig,
@@ -140,6 +143,15 @@ class TestWhiteLabelConfig:
                 custom_css="div { width: expression(alert(1)) }",
             )
 
+    def test_css_sanitization_other_patterns(self):
+        for css in (
+            "div { BEHAVIOR: url(x.htc) }",
+            "div { -moz-binding: url(x.xml#xss) }",
+            "div { background: URL( 'JavaScript' ) }",
+        ):
+            with pytest.raises(ValidationError, match="dangerous"):
+                WhiteLabelConfig(org_id="test", company_name="Test", custom_css=css)
+
     def test_css_sanitization_safe(self):
         config = WhiteLabelConfig(
             org_id="test",
@@ -236,6 +248,79 @@ class TestWhiteLabelService:
         assert config.company_name == "ACME Updated"
         assert config.primary_color == "#000000"
 
+    @pytest.mark.asyncio
+    async def test_get_config_served_from_cache(self, service, fake_redis, sample_config):
+        await service.save_config(sample_config)
+        assert await service.get_config("acme-corp") is not None
+
+        await fake_redis.delete("whitelabel:acme-corp")
+        cached = await service.get_config("acme-corp")
+        assert cached is not None
+        assert cached.company_name == "ACME Corporation"
+
+    @pytest.mark.asyncio
+    async def test_save_invalidates_cache(self, service, sample_config):
+        assert await service.get_config("acme-corp") is None
+        await service.save_config(sample_config)
+        config = await service.get_config("acme-corp")
+        assert config is not None
+
+        await service.delete_config("acme-corp")
+        assert await service.get_config("acme-corp") is None
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_with_zero_ttl(self, service, fake_redis, sample_config):
+        service._settings = service._settings.model_copy(update={"whitelabel_cache_ttl": 0})
+        await service.save_config(sample_config)
+        assert await service.get_config("acme-corp") is not None
+
+        await fake_redis.delete("whitelabel:acme-corp")
+        assert await service.get_config("acme-corp") is None
+        assert "acme-corp" not in service._config_cache
+
+    @pytest.mark.asyncio
+    async def test_cache_is_per_service(self, service, fake_redis, sample_config):
+        assert await service.get_config("acme-corp") is None
+        await WhiteLabelService(fake_redis).save_config(sample_config)
+        assert await WhiteLabelService(fake_redis).get_config("acme-corp") is not None
+
+    def test_dependency_shares_service_per_redis_client(self, fake_redis):
+        service = get_whitelabel_service(fake_redis)
+        assert get_whitelabel_service(fake_redis) is service
+        assert get_whitelabel_service(fakeredis.aioredis.FakeRedis()) is not service
+
+    @pytest.mark.asyncio
+    async def test_list_configs(self, service, fake_redis, sample_config):
+        await service.save_config(sample_config)
+        await service.save_config(WhiteLabelConfig(org_id="beta", company_name="Beta"))
+        await fake_redis.set("whitelabel:stray", "not-indexed")
+
+        assert sorted(await service.list_configs()) == ["acme-corp", "beta"]
+
+        await service.delete_config("beta")
+        assert await service.list_configs() == ["acme-corp"]
+
+    @pytest.mark.asyncio
+    async def test_list_configs_skips_expired(self, service, fake_redis, sample_config):
+        await service.save_config(sample_config)
+        await fake_redis.zadd("whitelabel_index", {"acme-corp": 0})
+        assert await service.list_configs() == []
+
+    @pytest.mark.asyncio
+    async def test_list_configs_backfills_legacy_configs(self, service, fake_redis, sample_config):
+        # Saved before the index existed: plain key, no index entry
+        await fake_redis.setex("whitelabel:legacy", 60, sample_config.model_dump_json())
+        await service.save_config(sample_config)
+
+        assert sorted(await service.list_configs()) == ["acme-corp", "legacy"]
+        assert 0 < await fake_redis.zscore("whitelabel_index", "legacy") - time.time() <= 60
+
+    @pytest.mark.asyncio
+    async def test_backfill_runs_once(self, service, fake_redis, sample_config):
+        assert await service.list_configs() == []
+        await fake_redis.setex("whitelabel:late", 60, sample_config.model_dump_json())
+        assert await service.list_configs() == []
+
 
 # --- Default helpers ---
 